@@ -0,0 +1,230 @@
+"""
+    Benchmark of the apis ALL, GET, POST, PUT, PATCH and DELETE of flask-sqlalchemy-api
+
+    python benchmark/bench.py --rows 10000 1000000 --models narrow wide --clients test wsgi --output result.json
+    python benchmark/bench.py --compare result.json --output new.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import threading
+import tracemalloc
+import http.client
+from importlib.metadata import version
+from werkzeug.serving import make_server, WSGIRequestHandler
+from models import create_app, row
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+ENDPOINTS = ['POST', 'GET', 'ALL', 'PUT', 'PATCH', 'DELETE']
+
+
+class TestClient(object):
+    """
+        requests by the test client of Flask (no network)
+    """
+    name = 'test'
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, url, data=None):
+        rv = self.client.open(url, method=method, json=data)
+        return rv.status_code, rv.data
+
+    def close(self):
+        pass
+
+
+class KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class WsgiClient(object):
+    """
+        requests by http (keep-alive connection) to a WSGI server of werkzeug in a thread
+    """
+    name = 'wsgi'
+
+    def __init__(self, app):
+        self.server = make_server('127.0.0.1', 0, app, request_handler=KeepAliveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.connection = http.client.HTTPConnection('127.0.0.1', self.server.server_port)
+
+    def request(self, method, url, data=None):
+        body = None
+        headers = {}
+        if data is not None:
+            body = json.dumps(data)
+            headers['Content-Type'] = 'application/json'
+        self.connection.request(method, url, body, headers)
+        response = self.connection.getresponse()
+        return response.status, response.read()
+
+    def close(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.thread.join()
+
+
+CLIENTS = {'test': TestClient, 'wsgi': WsgiClient}
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def peak_rss_kb():
+    """
+        return peak rss of the process since its start (not by endpoint: ru_maxrss never decreases)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def requests(cls, endpoint, rows, ops, created, generator):
+    """
+        return list of (method, url, data) for endpoint, PUT, PATCH and DELETE use the items created by POST
+    """
+    name = cls.__name__.lower()
+    patch_column = [c.name for c in cls.__table__.columns if c.name != 'id'][0]
+    if endpoint == 'POST':
+        return [('POST', '/api/v1/%s' % name, row(cls, rows + index)) for index in range(ops)]
+    if endpoint == 'GET':
+        return [('GET', '/api/v1/%s/%s' % (name, generator.randint(1, rows)), None) for _ in range(ops)]
+    if endpoint == 'ALL':
+        return [('GET', '/api/v1/%ss?limit=100&offset=%s' % (name, generator.randint(0, max(0, rows - 100))), None) for _ in range(ops)]
+    if endpoint == 'PUT':
+        return [('PUT', '/api/v1/%s/%s' % (name, key), row(cls, key)) for key in created]
+    if endpoint == 'PATCH':
+        return [('PATCH', '/api/v1/%s/%s' % (name, key), {patch_column: row(cls, -key)[patch_column]}) for key in created]
+    return [('DELETE', '/api/v1/%s/%s' % (name, key), None) for key in created]
+
+
+def run(client, todo, memory):
+    """
+        return measures of requests todo (latencies, errors, peak of python memory if memory) and bodies of successful responses
+    """
+    latencies = []
+    errors = 0
+    responses = []
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    for method, url, data in todo:
+        begin = time.perf_counter()
+        status, body = client.request(method, url, data)
+        latencies.append(time.perf_counter() - begin)
+        if status >= 400:
+            errors += 1
+        else:
+            responses.append(body)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    return {
+        'ops': len(todo),
+        'errors': errors,
+        'seconds': round(elapsed, 4),
+        'ops_per_s': round(len(todo) / elapsed, 1) if elapsed > 0 else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        'peak_traced_kb': peak,
+    }, responses
+
+
+def bench(args):
+    results = []
+    os.makedirs(args.data, exist_ok=True)
+    for model in args.models:
+        for rows in args.rows:
+            app, db, cls = create_app(os.path.join(args.data, 'bench_%s_%s.db' % (model, rows)), model, rows)
+            for client_name in args.clients:
+                client = CLIENTS[client_name](app)
+                generator = random.Random(args.seed)
+                created = []
+                try:
+                    for endpoint in ENDPOINTS:
+                        todo = requests(cls, endpoint, rows, args.ops, created, generator)
+                        measure, responses = run(client, todo, args.tracemalloc)
+                        if endpoint == 'POST':
+                            created = [json.loads(body)['id'] for body in responses]
+                        measure.update({'model': model, 'rows': rows, 'client': client_name, 'endpoint': endpoint})
+                        results.append(measure)
+                        print("%(model)-6s %(rows)8s %(client)-4s %(endpoint)-6s %(ops_per_s)10s ops/s  p50 %(p50_ms)8s ms  p99 %(p99_ms)8s ms  errors %(errors)s" % measure)
+                finally:
+                    client.close()
+            with app.app_context():
+                db.engine.dispose()
+    return results
+
+
+def commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, path):
+    with open(path) as f:
+        previous = {(r['model'], r['rows'], r['client'], r['endpoint']): r for r in json.load(f)['results']}
+    print("\ncompare with %s" % path)
+    for result in results:
+        old = previous.get((result['model'], result['rows'], result['client'], result['endpoint']))
+        if old is None or not old['ops_per_s'] or not result['ops_per_s']:
+            continue
+        print("%-6s %8s %-4s %-6s ops/s x%.2f  p99 x%.2f" % (result['model'], result['rows'], result['client'], result['endpoint'], result['ops_per_s'] / old['ops_per_s'], result['p99_ms'] / old['p99_ms']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="benchmark of apis of flask-sqlalchemy-api")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000], help="rows of seeded tables (10000, 1000000)")
+    parser.add_argument('--models', nargs='+', default=['narrow', 'wide'], choices=['narrow', 'wide'])
+    parser.add_argument('--clients', nargs='+', default=['test', 'wsgi'], choices=list(CLIENTS))
+    parser.add_argument('--ops', type=int, default=1000, help="requests by endpoint")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--data', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'), help="directory of seeded databases (kept between runs)")
+    parser.add_argument('--tracemalloc', action='store_true', help="measure peak of python memory (slower requests)")
+    parser.add_argument('--output', help="json file of results")
+    parser.add_argument('--compare', help="json file of previous results")
+    args = parser.parse_args(argv)
+    results = bench(args)
+    print("peak rss %s kb" % peak_rss_kb())
+    document = {
+        'commit': commit(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'flask': version('flask'),
+        'sqlalchemy': version('sqlalchemy'),
+        'ops': args.ops,
+        'peak_rss_kb': peak_rss_kb(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+    return document
+
+
+if __name__ == "__main__":
+    main()
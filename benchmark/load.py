@@ -0,0 +1,249 @@
+"""
+    Concurrent load test of flask-sqlalchemy-api on a sqlite file: M processes, each one with a threaded WSGI server
+    and N client threads, with a mixed read/write workload
+
+    python benchmark/load.py --processes 2 --threads 8 --requests 200 --mix GET=60,ALL=10,POST=15,PATCH=10,DELETE=5
+    python benchmark/load.py --wal --timeout 1 --retries 3 --output load.json
+"""
+import os
+import json
+import time
+import random
+import sqlite3
+import argparse
+import platform
+import threading
+import http.client
+import multiprocessing
+import queue as queue_module
+from importlib.metadata import version
+from werkzeug.serving import make_server, WSGIRequestHandler
+from models import create_app, row
+
+LOCK_ERRORS = ('database is locked', 'database table is locked', 'database is busy')
+
+
+class QuietHandler(WSGIRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def parse_mix(mix):
+    """
+        return list of (method, weight) from "GET=60,ALL=10,POST=15,PATCH=10,DELETE=5"
+    """
+    weights = []
+    for part in mix.split(','):
+        method, weight = part.split('=')
+        if method not in ('GET', 'ALL', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            raise ValueError("%s is not a method of mix" % method)
+        weights.append((method, int(weight)))
+    return weights
+
+
+def is_lock_error(status, body):
+    return status >= 400 and any(error in body for error in LOCK_ERRORS)
+
+
+class Client(object):
+    """
+        client thread: sends requests of the mix with retries on lock errors and records the results
+    """
+
+    def __init__(self, port, cls, rows, mix, args, seed):
+        self.connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+        self.cls = cls
+        self.name = cls.__name__.lower()
+        self.rows = rows
+        self.methods = [method for method, weight in mix]
+        self.weights = [weight for method, weight in mix]
+        self.args = args
+        self.generator = random.Random(seed)
+        self.column = [c.name for c in cls.__table__.columns if c.name != 'id'][0]
+        self.created = []
+        self.results = []
+
+    def send(self, method, url, data):
+        body = None if data is None else json.dumps(data)
+        self.connection.request(method, url, body, {} if body is None else {'Content-Type': 'application/json'})
+        response = self.connection.getresponse()
+        return response.status, response.read().decode(errors='replace')
+
+    def request(self, method):
+        """
+            return (method, http method, url, data) of a request of method, DELETE without created item is sent as GET
+        """
+        if method == 'DELETE' and len(self.created) == 0:
+            method = 'GET'
+        return (method,) + self.http_request(method)
+
+    def http_request(self, method):
+        key = self.generator.randint(1, self.rows)
+        if method == 'GET':
+            return 'GET', '/api/v1/%s/%s' % (self.name, key), None
+        if method == 'ALL':
+            return 'GET', '/api/v1/%ss?limit=50&offset=%s' % (self.name, self.generator.randint(0, max(0, self.rows - 50))), None
+        if method == 'POST':
+            return 'POST', '/api/v1/%s' % self.name, row(self.cls, key)
+        if method == 'PUT':
+            return 'PUT', '/api/v1/%s/%s' % (self.name, key), row(self.cls, key)
+        if method == 'PATCH':
+            return 'PATCH', '/api/v1/%s/%s' % (self.name, key), {self.column: row(self.cls, self.generator.randint(1, self.rows))[self.column]}
+        return 'DELETE', '/api/v1/%s/%s' % (self.name, self.created.pop()), None
+
+    def run(self):
+        for _ in range(self.args.requests):
+            method, http_method, url, data = self.request(self.generator.choices(self.methods, self.weights)[0])
+            retries = 0
+            start = time.perf_counter()
+            while True:
+                status, body = self.send(http_method, url, data)
+                if not is_lock_error(status, body) or retries >= self.args.retries:
+                    break
+                retries += 1
+                time.sleep(self.args.backoff * (2 ** (retries - 1)))
+            latency = time.perf_counter() - start
+            if method == 'POST' and status == 201:
+                self.created.append(json.loads(body)['id'])
+            kind = 'ok' if status < 400 else ('lock' if is_lock_error(status, body) else 'error')
+            self.results.append((method, kind, retries, latency))
+        self.connection.close()
+
+
+def worker(index, path, args, queue, go):
+    """
+        process: app on the sqlite file with a threaded WSGI server and args.threads clients started by go, results are put in queue
+    """
+    app, db, cls = create_app(path, args.model, args.rows, engine_options={'connect_args': {'timeout': args.timeout, 'check_same_thread': False}})
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mix = parse_mix(args.mix)
+    clients = [Client(server.server_port, cls, args.rows, mix, args, args.seed * 1000 + index * 100 + number) for number in range(args.threads)]
+    threads = [threading.Thread(target=client.run) for client in clients]
+    queue.put(('ready', index))
+    go.wait()
+    for thread_client in threads:
+        thread_client.start()
+    for thread_client in threads:
+        thread_client.join()
+    server.shutdown()
+    queue.put(('results', [result for client in clients for result in client.results]))
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def summary(results, elapsed):
+    latencies = [latency for method, kind, retries, latency in results]
+    lock = len([1 for method, kind, retries, latency in results if kind == 'lock'])
+    errors = len([1 for method, kind, retries, latency in results if kind == 'error'])
+    retried = [retries for method, kind, retries, latency in results]
+    return {
+        'requests': len(results),
+        'requests_per_s': round(len(results) / elapsed, 1) if elapsed > 0 else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+        'max_ms': round(max(latencies) * 1000, 3) if latencies else None,
+        'lock_errors': lock,
+        'lock_error_rate': round(lock / len(results), 4) if results else None,
+        'other_errors': errors,
+        'retries': sum(retried),
+        'retried_requests': len([1 for retries in retried if retries > 0]),
+    }
+
+
+def prepare(args):
+    """
+        seed the sqlite file and set its journal mode (persistent in the file), return path of the file
+    """
+    os.makedirs(args.data, exist_ok=True)
+    path = os.path.join(args.data, 'load_%s_%s.db' % (args.model, args.rows))
+    app, db, cls = create_app(path, args.model, args.rows)
+    with app.app_context():
+        db.engine.dispose()
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA journal_mode=%s' % ('WAL' if args.wal else 'DELETE'))
+    connection.close()
+    return path
+
+
+def receive(queue, processes, expected):
+    """
+        return values of the messages expected of all processes, raise RuntimeError if a process stops before
+    """
+    values = []
+    while len(values) < len(processes):
+        try:
+            kind, value = queue.get(timeout=1)
+        except queue_module.Empty:
+            if any(process.exitcode not in (None, 0) for process in processes):
+                raise RuntimeError("a load process stopped before %s" % expected)
+            continue
+        if kind == expected:
+            values.append(value)
+    return values
+
+
+def load(args):
+    path = prepare(args)
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    go = context.Event()
+    processes = [context.Process(target=worker, args=(index, path, args, queue, go)) for index in range(args.processes)]
+    for process in processes:
+        process.start()
+    receive(queue, processes, 'ready')
+    go.set()
+    start = time.perf_counter()
+    results = [result for value in receive(queue, processes, 'results') for result in value]
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    document = {
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'sqlalchemy': version('sqlalchemy'),
+        'settings': {key: value for key, value in vars(args).items() if key not in ('output', 'data')},
+        'total': summary(results, elapsed),
+        'methods': {method: summary([result for result in results if result[0] == method], elapsed) for method in sorted(set(result[0] for result in results))},
+    }
+    return document
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="concurrent load test of apis of flask-sqlalchemy-api on sqlite")
+    parser.add_argument('--processes', type=int, default=2, help="server processes on the same sqlite file")
+    parser.add_argument('--threads', type=int, default=4, help="client threads by process")
+    parser.add_argument('--requests', type=int, default=200, help="requests by thread")
+    parser.add_argument('--mix', default='GET=60,ALL=10,POST=15,PATCH=10,DELETE=5', help="weights of methods")
+    parser.add_argument('--model', default='narrow', choices=['narrow', 'wide'])
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--timeout', type=float, default=5.0, help="sqlite busy timeout in seconds")
+    parser.add_argument('--wal', action='store_true', help="journal mode WAL (default DELETE)")
+    parser.add_argument('--retries', type=int, default=0, help="retries of a request on lock error")
+    parser.add_argument('--backoff', type=float, default=0.01, help="first delay of retry in seconds (doubled by retry)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--data', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'), help="directory of seeded databases")
+    parser.add_argument('--output', help="json file of results")
+    args = parser.parse_args(argv)
+    document = load(args)
+    total = document['total']
+    print("%(requests)s requests  %(requests_per_s)s req/s  p50 %(p50_ms)s ms  p99 %(p99_ms)s ms  max %(max_ms)s ms" % total)
+    print("lock errors %(lock_errors)s (rate %(lock_error_rate)s)  other errors %(other_errors)s  retries %(retries)s on %(retried_requests)s requests" % total)
+    for method, measure in document['methods'].items():
+        print("%-6s %6s requests  p50 %8s ms  p99 %8s ms  lock errors %s  retries %s" % (method, measure['requests'], measure['p50_ms'], measure['p99_ms'], measure['lock_errors'], measure['retries']))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+    return document
+
+
+if __name__ == "__main__":
+    main()
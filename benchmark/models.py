@@ -0,0 +1,80 @@
+"""
+    Models, seeding and application used by the benchmarks of flask-sqlalchemy-api
+"""
+import os
+from flask import Flask
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest
+from sqlalchemy import insert, select, func
+
+METHODS = ['ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH']
+WIDE_COLUMNS = 30
+
+
+def define_models(db):
+    """
+        return models narrow (3 columns) and wide (WIDE_COLUMNS columns of integer, string, float, date)
+    """
+    class Narrow(db.Model):
+        __tablename__ = 'narrow'
+        id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+        title = db.Column(db.String, nullable=False)
+        status = db.Column(db.String, nullable=True)
+
+    columns = {'__tablename__': 'wide', 'id': db.Column(db.Integer, primary_key=True, autoincrement=True)}
+    for index in range(1, WIDE_COLUMNS):
+        kind = (db.Integer, db.String, db.Float, db.Boolean)[index % 4]
+        columns['col%02d' % index] = db.Column(kind, nullable=True)
+    Wide = type('Wide', (db.Model,), columns)
+    return {'narrow': Narrow, 'wide': Wide}
+
+
+def row(cls, index):
+    """
+        return values of row index for cls
+    """
+    values = {}
+    for column in cls.__table__.columns:
+        if column.name == 'id':
+            continue
+        python_type = column.type.python_type
+        if python_type is bool:
+            values[column.name] = index % 2 == 0
+        elif python_type is int:
+            values[column.name] = index
+        elif python_type is float:
+            values[column.name] = index / 7
+        else:
+            values[column.name] = '%s %s' % (column.name, index)
+    return values
+
+
+def seed(db, cls, rows, batch=10000):
+    """
+        insert rows in table of cls (only the missing rows of an existing database)
+    """
+    count = db.session.execute(select(func.count()).select_from(cls)).scalar()
+    for start in range(count, rows, batch):
+        db.session.execute(insert(cls), [row(cls, index) for index in range(start + 1, min(start + batch, rows) + 1)])
+        db.session.commit()
+
+
+def create_app(path, model, rows, uri=None, engine_options=None):
+    """
+        return (app, db, cls) with apis of METHODS on model ('narrow' or 'wide') seeded with rows in the sqlite database path
+    """
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = uri or "sqlite:///%s" % os.path.abspath(path)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options or {}
+    db = SQLAlchemy()
+    cls = define_models(db)[model]
+    apiManager = ApiRest(db)
+    for method in METHODS:
+        apiManager.add_api(cls, method)
+    app.register_blueprint(apiManager)
+    app.apiManager = apiManager
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        seed(db, cls, rows)
+    return app, db, cls
@@ -1 +1,4 @@
-from .main import ApiRest, error_api, Swagger
+from .main import ApiRest, error_api, Swagger, model_to_dict, serializer_plan
+from .cache import LRUCache
+from .metrics import Metrics, QueryBudgetExceeded
+from .aio import AsyncApiRest
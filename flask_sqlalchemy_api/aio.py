@@ -0,0 +1,63 @@
+from contextvars import ContextVar
+from .main import ApiRest
+
+
+class AsyncApiRest(ApiRest):
+    """
+        ApiRest with async views on AsyncSession of async_session (async_sessionmaker), for Flask async views (pip install flask[async])
+
+        Views run the code of ApiRest with AsyncSession.run_sync, DB I/O is awaited by the event loop
+    """
+
+    def __init__(self, db, async_session, *args, **kwargs):
+        ApiRest.__init__(self, db, *args, **kwargs)
+        self._async_session = async_session
+        self._sync_session = ContextVar('sync_session')
+
+    def _session(self):
+        return self._sync_session.get()
+
+    def _run(self, session, fct, args, kwargs):
+        token = self._sync_session.set(session)
+        try:
+            return fct(*args, **kwargs)
+        finally:
+            self._sync_session.reset(token)
+
+    def _async_view(self, fct):
+        async def view(*args, **kwargs):
+            async with self._async_session() as session:
+                return await session.run_sync(self._run, fct, args, kwargs)
+        return view
+
+    def _all(self, cls, serialize, stream=False):
+        if stream:
+            raise ValueError("stream is not supported by AsyncApiRest")
+        return self._async_view(ApiRest._all(self, cls, serialize))
+
+    def _post(self, cls, serialize):
+        return self._async_view(ApiRest._post(self, cls, serialize))
+
+    def _get(self, cls, serialize):
+        return self._async_view(ApiRest._get(self, cls, serialize))
+
+    def _del(self, cls, serialize):
+        return self._async_view(ApiRest._del(self, cls, serialize))
+
+    def _put(self, cls, serialize):
+        return self._async_view(ApiRest._put(self, cls, serialize))
+
+    def _patch(self, cls, serialize):
+        return self._async_view(ApiRest._patch(self, cls, serialize))
+
+    def _patch_all(self, cls, serialize):
+        return self._async_view(ApiRest._patch_all(self, cls, serialize))
+
+    def _del_all(self, cls, serialize):
+        return self._async_view(ApiRest._del_all(self, cls, serialize))
+
+    def _relation(self, cls, relationship, serialize):
+        return self._async_view(ApiRest._relation(self, cls, relationship, serialize))
+
+    def _aggregate(self, cls, serialize):
+        return self._async_view(ApiRest._aggregate(self, cls, serialize))
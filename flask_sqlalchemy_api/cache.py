@@ -0,0 +1,53 @@
+from collections import OrderedDict
+import threading
+import time
+
+
+class LRUCache(object):
+    """
+        Bounded LRU cache with ttl for responses of ApiRest, entries are invalidated by model
+
+        A backend for ApiRest.cache needs only get(model, key), set(model, key, value) and invalidate(model)
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, model, key):
+        with self._lock:
+            entry = self._items.get((model, key))
+            if entry is None:
+                self.misses = self.misses + 1
+                return None
+            if entry[0] < self._timer():
+                del self._items[(model, key)]
+                self.misses = self.misses + 1
+                return None
+            self._items.move_to_end((model, key))
+            self.hits = self.hits + 1
+            return entry[1]
+
+    def set(self, model, key, value):
+        with self._lock:
+            self._items[(model, key)] = (self._timer() + self.ttl, value)
+            self._items.move_to_end((model, key))
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def invalidate(self, model):
+        with self._lock:
+            for key in [key for key in self._items if key[0] == model]:
+                del self._items[key]
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
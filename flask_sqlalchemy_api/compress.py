@@ -0,0 +1,100 @@
+from flask import request
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class ZlibCompressor(object):
+    """
+        gzip (wbits 31) or deflate (wbits 15) compressor
+    """
+
+    def __init__(self, wbits, level=6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def sync(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self):
+        return self._compressor.flush()
+
+
+class ZstdCompressor(object):
+
+    def __init__(self, level=3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def sync(self):
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def flush(self):
+        return self._compressor.flush()
+
+
+COMPRESSORS = {'gzip': lambda: ZlibCompressor(31), 'deflate': lambda: ZlibCompressor(15)}
+if zstandard is not None:
+    COMPRESSORS['zstd'] = lambda: ZstdCompressor()
+
+
+def negotiate_encoding(encodings):
+    """
+        return the content encoding from header Accept-Encoding and encodings, None if no encoding is accepted
+    """
+    return request.accept_encodings.best_match([encoding for encoding in encodings if encoding in COMPRESSORS])
+
+
+def compress_stream(chunks, compressor):
+    """
+        compress chunks of a generator response, each chunk is flushed for the client
+    """
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            data = compressor.compress(chunk) + compressor.sync()
+            if len(data) > 0:
+                yield data
+        yield compressor.flush()
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def compress_response(response, encodings, min_size):
+    """
+        compress response (body larger than min_size or stream) with the best of encodings accepted by client
+    """
+    if response.status_code < 200 or response.status_code in (204, 304) or 'Content-Encoding' in response.headers:
+        return response
+    encoding = negotiate_encoding(encodings)
+    response.vary.add('Accept-Encoding')
+    if encoding is None:
+        return response
+    if response.is_streamed:
+        response.response = compress_stream(response.response, COMPRESSORS[encoding]())
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+        compressor = COMPRESSORS[encoding]()
+        response.set_data(compressor.compress(data) + compressor.flush())
+    response.headers['Content-Encoding'] = encoding
+    tag, weak = response.get_etag()
+    if tag is not None:
+        # a strong validator differs between content codings
+        response.set_etag(encoded_etag(tag, encoding), weak)
+    return response
+
+
+def encoded_etag(tag, encoding):
+    return '%s-%s' % (tag, encoding)
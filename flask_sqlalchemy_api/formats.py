@@ -0,0 +1,217 @@
+from flask import request, current_app
+import csv
+import datetime
+import decimal
+import enum
+import io
+import json
+import uuid
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON = 'application/json'
+NDJSON = 'application/x-ndjson'
+CSV = 'text/csv'
+MSGPACK = 'application/msgpack'
+
+
+def json_default(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.name
+    raise TypeError("Object of type %s is not JSON serializable" % value.__class__.__name__)
+
+
+class StdJson(object):
+    """
+        json backend on stdlib json, with datetime, date, time, Decimal, UUID and Enum (name)
+    """
+
+    def dumps(self, data):
+        return json.dumps(data, default=json_default, separators=(',', ':'), ensure_ascii=False)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+def enum_names(data):
+    """
+        return data (dict, list, tuple) with Enum replaced by their name
+    """
+    if isinstance(data, dict):
+        return {key: enum_names(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [enum_names(value) for value in data]
+    if isinstance(data, enum.Enum):
+        return data.name
+    return data
+
+
+class OrJson(object):
+    """
+        json backend on orjson, dumps returns bytes
+
+        orjson encodes Enum by value: the default serializer already sends the name of Enum columns, with enum_names
+        the data of a specific serialize is walked to replace Enum by their name (slower)
+    """
+
+    def __init__(self, enum_names=False):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        self.enum_names = enum_names
+
+    def dumps(self, data):
+        if self.enum_names:
+            data = enum_names(data)
+        return orjson.dumps(data, default=json_default)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+def get_json_backend(backend):
+    """
+        return json backend from backend: 'json', 'orjson', 'auto' (orjson if installed) or object with dumps and loads
+    """
+    if backend is None or not isinstance(backend, str):
+        return backend
+    if backend == 'json':
+        return StdJson()
+    if backend == 'orjson':
+        return OrJson()
+    if backend == 'auto':
+        return OrJson() if orjson is not None else StdJson()
+    raise ValueError("%s is not a json backend (json, orjson, auto)" % backend)
+
+
+def mimetypes():
+    if msgpack is None:
+        return [JSON, NDJSON, CSV]
+    return [JSON, NDJSON, CSV, MSGPACK]
+
+
+def negotiate():
+    """
+        return the mimetype of response from header Accept (json by default)
+    """
+    return request.accept_mimetypes.best_match(mimetypes(), default=JSON)
+
+
+def csv_rows(rows):
+    """
+        yield lines of csv for rows (dict or None for an empty line), header from the first row not None
+    """
+    output = io.StringIO()
+    writer = None
+    missing = 0
+    for row in rows:
+        if writer is None:
+            if row is None:
+                missing += 1
+                continue
+            writer = csv.DictWriter(output, fieldnames=list(row.keys()), extrasaction='ignore')
+            writer.writeheader()
+            output.write('\r\n' * missing)
+        if row is not None:
+            writer.writerow(row)
+        else:
+            output.write('\r\n')
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate(0)
+    if writer is None and missing > 0:
+        yield '\r\n' * missing
+
+
+def join(parts, sep, end=''):
+    """
+        return parts of dumps (str, or bytes of orjson) joined by sep, with end after the last part
+    """
+    if len(parts) == 0:
+        return ''
+    if isinstance(parts[0], bytes):
+        return sep.encode().join(parts) + end.encode()
+    return sep.join(parts) + end
+
+
+def encode(mimetype, data, dumps=None):
+    """
+        return body of data (dict for an item, list for items) for mimetype, json is encoded by dumps (json of flask by default)
+    """
+    dumps = dumps or current_app.json.dumps
+    if mimetype == NDJSON:
+        return join([dumps(row) for row in (data if isinstance(data, list) else [data])], '\n', '\n')
+    if mimetype == CSV:
+        return ''.join(csv_rows(data if isinstance(data, list) else [data]))
+    if mimetype == MSGPACK:
+        return msgpack.packb(data, default=str)
+    return dumps(data)
+
+
+def json_array(items, serialize, size, dumps=None):
+    dumps = dumps or current_app.json.dumps
+    yield '['
+    sep = ''
+    chunk = []
+    for item in items:
+        chunk.append(dumps(serialize(item)))
+        if len(chunk) >= size:
+            if sep:
+                yield sep
+            yield join(chunk, ',')
+            sep = ','
+            chunk = []
+    if len(chunk) > 0:
+        if sep:
+            yield sep
+        yield join(chunk, ',')
+    yield ']'
+
+
+def ndjson_lines(items, serialize, size, dumps=None):
+    dumps = dumps or current_app.json.dumps
+    chunk = []
+    for item in items:
+        chunk.append(dumps(serialize(item)))
+        if len(chunk) >= size:
+            yield join(chunk, '\n', '\n')
+            chunk = []
+    if len(chunk) > 0:
+        yield join(chunk, '\n', '\n')
+
+
+def csv_lines(items, serialize, size, dumps=None):
+    chunk = []
+    for line in csv_rows(serialize(item) for item in items):
+        chunk.append(line)
+        if len(chunk) >= size:
+            yield ''.join(chunk)
+            chunk = []
+    if len(chunk) > 0:
+        yield ''.join(chunk)
+
+
+def msgpack_items(items, serialize, size, dumps=None):
+    # msgpack array header needs the length, items are sent as a stream of objects
+    chunk = []
+    for item in items:
+        chunk.append(msgpack.packb(serialize(item), default=str))
+        if len(chunk) >= size:
+            yield b''.join(chunk)
+            chunk = []
+    if len(chunk) > 0:
+        yield b''.join(chunk)
+
+
+STREAMS = {JSON: json_array, NDJSON: ndjson_lines, CSV: csv_lines, MSGPACK: msgpack_items}
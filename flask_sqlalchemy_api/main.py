@@ -1,10 +1,26 @@
-from flask import Blueprint, request, current_app
+from flask import Blueprint, Response, request, current_app, stream_with_context, abort
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint, Integer, Float, BOOLEAN, Boolean, Enum
+from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint, Integer, Float, BOOLEAN, Boolean, Enum, Numeric, DateTime, Date, Time, inspect, tuple_, and_, or_, insert, update, delete, select, bindparam, func
 from sqlalchemy.sql import text
+from sqlalchemy.exc import NoResultFound, MultipleResultsFound
+from sqlalchemy.orm import load_only, selectinload, joinedload
 from sqlalchemy.orm.exc import UnmappedInstanceError
 from functools import wraps
+from inspect import iscoroutinefunction
+from .cache import LRUCache
+from .formats import JSON, CSV, STREAMS, negotiate, encode, get_json_backend
+from .compress import compress_response, negotiate_encoding, encoded_etag
+from .metrics import CONTENT_TYPE, RequestTimer, QueryBudgetExceeded, current_timer, phase, add_rows, listen_engines
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import http_date
+from urllib.parse import urlencode
+import base64
+import datetime
+import decimal
+import enum
+import hashlib
 import logging
+import re
 import json
 
 __version__ = '0.9.3'
@@ -13,11 +29,192 @@ SQLTYPE_TO_FLASKTYPE = {Integer: 'int', Float: 'float'}
 SQLTYPE_TO_SWAGGERTYPE = {Integer: 'integer', Float: 'number', BOOLEAN: 'boolean', Boolean: 'boolean'}
 
 
+def _isoformat(value):
+    return value.isoformat()
+
+
+def _http_date(value):
+    return http_date(value)
+
+
+def _enum_name(value):
+    if isinstance(value, enum.Enum):
+        return value.name
+    return value
+
+
+def _converter(column):
+    if isinstance(column.type, (DateTime, Date)):
+        # same format as the json provider of Flask (HTTP date)
+        return _http_date
+    if isinstance(column.type, Time):
+        return _isoformat
+    if isinstance(column.type, Enum):
+        return _enum_name
+    if isinstance(column.type, Numeric) and not isinstance(column.type, Float) and column.type.asdecimal:
+        return str
+    return None
+
+
+class SerializerPlan(object):
+    """
+        Serializer compiled once per model: visible columns, attribute getters and type converters
+    """
+
+    def __init__(self, cls, columns=None):
+        mapper = inspect(cls)
+        self.cls = cls
+        if columns is None:
+            columns = [c for c in cls.__table__.columns if 'not visible by api' not in str(c.comment)]
+        self.columns = columns
+        self.keys = [c.name for c in self.columns]
+        self.attributes = [(c.name, mapper.get_property_by_column(c).key) for c in self.columns]
+        self.converters = [(c.name, _converter(c)) for c in self.columns if _converter(c) is not None]
+        self._projections = LRUCache(maxsize=128, ttl=float('inf'))
+
+    def project(self, names):
+        """
+            return the plan restricted to names (cached, at most 128 plans), raise ValueError if a name is not visible
+            or repeated
+        """
+        names = tuple(names)
+        for index, name in enumerate(names):
+            if name not in self.keys:
+                raise ValueError("field %s is not a visible column of %s" % (name, self.cls.__name__))
+            if name in names[:index]:
+                raise ValueError("field %s is repeated" % name)
+        plan = self._projections.get(self.cls, names)
+        if plan is None:
+            plan = SerializerPlan(self.cls, [self.columns[self.keys.index(name)] for name in names])
+            self._projections.set(self.cls, names, plan)
+        return plan
+
+    def load_only(self, *columns):
+        """
+            return the loader option which selects only the columns of plan (and columns)
+        """
+        mapper = inspect(self.cls)
+        return load_only(*[getattr(self.cls, mapper.get_property_by_column(c).key) for c in self.columns + [c for c in columns if c not in self.columns]])
+
+    def __call__(self, obj):
+        dct = {name: getattr(obj, attribute) for name, attribute in self.attributes}
+        for name, converter in self.converters:
+            if dct[name] is not None:
+                dct[name] = converter(dct[name])
+        return dct
+
+
+_SERIALIZER_PLANS = {}
+
+
+def serializer_plan(cls):
+    plan = _SERIALIZER_PLANS.get(cls)
+    if plan is None:
+        plan = _SERIALIZER_PLANS[cls] = SerializerPlan(cls)
+    return plan
+
+
 def model_to_dict(obj):
-    return {c.name: getattr(obj, c.name) for c in obj.__table__.columns if 'not visible by api' not in str(c.comment)}
+    return serializer_plan(obj.__class__)(obj)
+
+
+def projection(cls, serialize, fields):
+    """
+        return (plan, serialize) for the parameter fields, plan is None if all columns are needed
+    """
+    if fields is None or len(fields.strip()) == 0:
+        return None, serialize
+    plan = serializer_plan(cls).project([name.strip() for name in fields.split(',')])
+    if isinstance(serialize, SerializerPlan):
+        return plan, plan
+    return None, lambda obj: {key: value for key, value in serialize(obj).items() if key in plan.keys}
+
+
+class Expansion(object):
+    """
+        Embedding of related objects compiled once per model and parameter expand: loader options and serializers
+    """
+
+    def __init__(self, cls, tree, key=None):
+        mapper = inspect(cls)
+        self.key = key
+        self.relationships = []
+        self.options = []
+        for name in sorted(tree):
+            if name not in mapper.relationships:
+                raise ValueError("expand %s is not a relationship of %s" % (name, cls.__name__))
+            prop = mapper.relationships[name]
+            if any('not visible by api' in str(column.comment) for column in prop.local_columns):
+                raise ValueError("expand %s is not a relationship of %s" % (name, cls.__name__))
+            target = prop.mapper.class_
+            child = Expansion(target, tree[name])
+            # a collection is loaded by a second query (IN on the keys), a single object by a join
+            loader = selectinload if prop.uselist else joinedload
+            self.options.extend([loader(prop.class_attribute)] + [loader(prop.class_attribute).options(option) for option in child.options])
+            self.relationships.append((name, prop.uselist, serializer_plan(target), child))
+
+    def embed(self, obj, dct):
+        for name, uselist, plan, child in self.relationships:
+            value = getattr(obj, name)
+            if uselist:
+                dct[name] = [child.embed(item, plan(item)) for item in value]
+            else:
+                dct[name] = None if value is None else child.embed(value, plan(value))
+        return dct
+
+
+_EXPANSIONS = {}
+
+
+def expansion(cls, serialize, expand, depth):
+    """
+        return (expansion, serialize) for the parameter expand "rel1,rel2.sub", expansion is None without expand
+    """
+    if expand is None or len(expand.strip()) == 0:
+        return None, serialize
+    paths = tuple(sorted(set(path.strip() for path in expand.split(',') if len(path.strip()) > 0)))
+    result = _EXPANSIONS.get((cls, paths))
+    if result is None:
+        tree = {}
+        for path in paths:
+            if len(path.split('.')) > depth:
+                raise ValueError("expand %s is deeper than %s" % (path, depth))
+            node = tree
+            for name in path.split('.'):
+                node = node.setdefault(name, {})
+        result = _EXPANSIONS[(cls, paths)] = Expansion(cls, tree, paths)
+    elif max(len(path.split('.')) for path in paths) > depth:
+        raise ValueError("expand %s is deeper than %s" % (expand, depth))
+    return result, lambda obj: result.embed(obj, serialize(obj))
+
+
+_RELATED_TABLES = {}
+
+
+def related_tables(cls, depth):
+    """
+        return names of tables linked to cls by relationships (in both directions) within depth
+    """
+    tables = _RELATED_TABLES.get((cls, depth))
+    if tables is None:
+        models = {cls}
+        for _ in range(depth):
+            for mapper in list(inspect(cls).registry.mappers):
+                for prop in mapper.relationships:
+                    if mapper.class_ in models:
+                        models.add(prop.mapper.class_)
+                    elif prop.mapper.class_ in models:
+                        models.add(mapper.class_)
+        tables = _RELATED_TABLES[(cls, depth)] = sorted(model.__table__.name for model in models)
+    return tables
+
+
+_CONSTRAINTS = {}
 
 
 def getConstraint(cls):
+    if cls in _CONSTRAINTS:
+        return _CONSTRAINTS[cls]
     constraint = None
     if len([constraint for constraint in cls.__table__.constraints if isinstance(constraint, UniqueConstraint)]) > 0:
         constraint = [constraint for constraint in cls.__table__.constraints if isinstance(constraint, UniqueConstraint)][0]
@@ -25,12 +222,286 @@ def getConstraint(cls):
         constraint = [constraint for constraint in cls.__table__.constraints if isinstance(constraint, PrimaryKeyConstraint)][0]
     if constraint is None:
         raise "%s does not PrimaryKeyConstraint or UniqueConstraint" % cls.__name__
+    _CONSTRAINTS[cls] = constraint
     return constraint
 
 
+_UNIQUE_ENDPOINTS = {}
+
+
 def unique_endpoint(cls):
-    constraint = getConstraint(cls)
-    return ("/".join(["<%s:%s>" % (SQLTYPE_TO_FLASKTYPE.get(column.type.__class__, 'string'), column.name) for column in constraint.columns]))
+    if cls not in _UNIQUE_ENDPOINTS:
+        constraint = getConstraint(cls)
+        _UNIQUE_ENDPOINTS[cls] = "/".join(["<%s:%s>" % (SQLTYPE_TO_FLASKTYPE.get(column.type.__class__, 'string'), column.name) for column in constraint.columns])
+    return _UNIQUE_ENDPOINTS[cls]
+
+
+FILTER_OPERATORS = {
+    'eq': lambda column, value: column == value,
+    'ne': lambda column, value: column != value,
+    'lt': lambda column, value: column < value,
+    'le': lambda column, value: column <= value,
+    'gt': lambda column, value: column > value,
+    'ge': lambda column, value: column >= value,
+    'like': lambda column, value: column.like(value),
+    'ilike': lambda column, value: column.ilike(value),
+    'in': lambda column, value: column.in_(value),
+    'isnull': lambda column, value: column.is_(None) if value else column.is_not(None),
+}
+
+
+def column_converter(column):
+    """
+        return converter of a parameter value (str) to the python type of column (subclasses of types included)
+    """
+    if isinstance(column.type, (Boolean, BOOLEAN)):
+        return lambda value: value.lower() in ('1', 'true', 'yes')
+    if isinstance(column.type, Integer):
+        return int
+    if isinstance(column.type, Numeric):
+        return decimal.Decimal if column.type.asdecimal else float
+    if isinstance(column.type, DateTime):
+        return datetime.datetime.fromisoformat
+    if isinstance(column.type, Date):
+        return datetime.date.fromisoformat
+    if isinstance(column.type, Time):
+        return datetime.time.fromisoformat
+    return str
+
+
+def parse_filter(cls, args):
+    """
+        return (name, operator, value) from args "column__operator=value" on visible columns of cls
+    """
+    filters = []
+    for key, value in args.items(multi=True):
+        if '__' not in key:
+            continue
+        name, operator = key.rsplit('__', 1)
+        if operator not in FILTER_OPERATORS and name not in cls.__table__.columns:
+            continue
+        if name not in cls.__table__.columns or 'not visible by api' in str(cls.__table__.columns[name].comment):
+            raise ValueError("filter %s is not a column of %s" % (name, cls.__name__))
+        if operator not in FILTER_OPERATORS:
+            raise ValueError("operator %s of filter %s is not valid (%s)" % (operator, key, ', '.join(FILTER_OPERATORS)))
+        column = cls.__table__.columns[name]
+        if operator == 'isnull':
+            value = value.lower() in ('1', 'true', 'yes')
+        elif operator == 'in':
+            value = [column_converter(column)(part) for part in value.split(',')]
+        elif operator not in ('like', 'ilike'):
+            value = column_converter(column)(value)
+        filters.append((name, operator, value))
+    return filters
+
+
+def filter_clauses(cls, filters, bind=False):
+    """
+        return clauses of filters, with bind values are bindparam filter_<index> (except isnull)
+    """
+    clauses = []
+    for index, (name, operator, value) in enumerate(filters):
+        if bind and operator != 'isnull':
+            value = bindparam('filter_%s' % index, expanding=operator == 'in')
+        clauses.append(FILTER_OPERATORS[operator](cls.__table__.columns[name], value))
+    return clauses
+
+
+def filter_params(filters):
+    return {'filter_%s' % index: value for index, (name, operator, value) in enumerate(filters) if operator != 'isnull'}
+
+
+def structured_filter(cls, args):
+    """
+        return clauses with bound parameters from args "column__operator=value" on visible columns of cls
+    """
+    return filter_clauses(cls, parse_filter(cls, args))
+
+
+def order_by_clauses(cls, order_by, raw):
+    """
+        return clauses for orderby "column [asc|desc], ...", text(order_by) if it is not a list of columns and raw is True
+    """
+    clauses = []
+    for part in [part.split() for part in order_by.split(',') if len(part.strip()) > 0]:
+        if len(part) > 2 or part[0] not in cls.__table__.columns or (len(part) == 2 and part[1].lower() not in ('asc', 'desc')):
+            if raw:
+                return [text(order_by)]
+            raise ValueError("orderby %s is not valid, use 'column [asc|desc], ...'" % order_by)
+        column = cls.__table__.columns[part[0]]
+        clauses.append(column.desc() if len(part) == 2 and part[1].lower() == 'desc' else column.asc())
+    return clauses
+
+
+AGGREGATE_FUNCTIONS = {
+    'count': func.count,
+    'sum': func.sum,
+    'avg': func.avg,
+    'min': func.min,
+    'max': func.max,
+}
+
+
+def visible_column(cls, name, parameter):
+    if name not in cls.__table__.columns or 'not visible by api' in str(cls.__table__.columns[name].comment):
+        raise ValueError("%s %s is not a column of %s" % (parameter, name, cls.__name__))
+    return cls.__table__.columns[name]
+
+
+def parse_aggregate(cls, groupby, agg):
+    """
+        return (columns, aggregates) from groupby "column, ..." and agg "function(column|*), ..." on visible columns of cls
+
+        aggregates are (name, function, column), name is "function(column)"
+    """
+    columns = [visible_column(cls, name.strip(), 'groupby') for name in (groupby or '').split(',') if len(name.strip()) > 0]
+    aggregates = []
+    for part in [part.strip() for part in (agg or 'count(*)').split(',') if len(part.strip()) > 0]:
+        match = re.match(r'^(\w+)\s*\(\s*(\*|\w+)\s*\)$', part)
+        if match is None or match.group(1).lower() not in AGGREGATE_FUNCTIONS:
+            raise ValueError("agg %s is not valid, use 'function(column), ...' with function in %s" % (part, ', '.join(AGGREGATE_FUNCTIONS)))
+        function, name = match.group(1).lower(), match.group(2)
+        if name == '*' and function != 'count':
+            raise ValueError("agg %s is not valid, * is only for count" % part)
+        aggregates.append(('%s(%s)' % (function, name), function, None if name == '*' else visible_column(cls, name, 'agg')))
+    return columns, aggregates
+
+
+ESTIMATED_COUNTS = {
+    'sqlite': "SELECT stat FROM sqlite_stat1 WHERE tbl = :table",
+    'postgresql': "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)",
+    'mysql': "SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = :table",
+    'mariadb': "SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = :table",
+}
+
+
+def estimated_count(session, cls):
+    """
+        return count of rows of cls from statistics of database (sqlite_stat1, pg_class, information_schema), None if unknown
+    """
+    dialect = session.get_bind(mapper=inspect(cls)).dialect.name
+    if dialect not in ESTIMATED_COUNTS:
+        return None
+    if dialect == 'sqlite' and session.execute(text("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")).first() is None:
+        return None
+    value = session.execute(text(ESTIMATED_COUNTS[dialect]), {'table': cls.__table__.name}).scalar()
+    if value is None:
+        return None
+    if dialect == 'sqlite':
+        value = value.split()[0]
+    value = int(float(value))
+    # reltuples is -1 for a table never analyzed
+    return value if value >= 0 else None
+
+
+def cursor_value(value):
+    """
+        return value of a keyset column as text read by column_converter (ISO 8601 for dates, name for Enum)
+    """
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(order_by, values):
+    return base64.urlsafe_b64encode(json.dumps([order_by, [cursor_value(value) for value in values]]).encode()).decode()
+
+
+def decode_cursor(order_by, cursor, columns):
+    """
+        return values of keyset columns from cursor, converted to the python type of columns
+    """
+    try:
+        cursor_order_by, values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("cursor %s is not valid" % cursor)
+    if cursor_order_by != order_by or not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("cursor %s is not valid for orderby %s" % (cursor, order_by))
+    return [None if value is None else column_converter(column)(value) for column, value in zip(columns, values)]
+
+
+def keyset_columns(cls, keys, order_by):
+    """
+        return columns and direction used by cursor pagination for orderby "column [asc|desc]"
+    """
+    desc = False
+    columns = []
+    if len(order_by.split()) > 0:
+        name = order_by.split()[0]
+        if name not in cls.__table__.columns or 'not visible by api' in str(cls.__table__.columns[name].comment):
+            raise ValueError("orderby %s is not a column of %s" % (name, cls.__name__))
+        if len(order_by.split()) > 2 or (len(order_by.split()) == 2 and order_by.split()[1].lower() not in ('asc', 'desc')):
+            raise ValueError("orderby %s is not valid with cursor, use 'column [asc|desc]'" % order_by)
+        desc = len(order_by.split()) == 2 and order_by.split()[1].lower() == 'desc'
+        columns.append(cls.__table__.columns[name])
+    return columns + [column for column in keys if column not in columns], desc
+
+
+def keyset_order(columns, desc):
+    """
+        return order of cursor pagination, NULLs of the nullable first column are first in asc and last in desc
+    """
+    clauses = [column.desc() if desc else column.asc() for column in columns]
+    if columns[0].nullable:
+        clauses[0] = clauses[0].nulls_last() if desc else clauses[0].nulls_first()
+    return clauses
+
+
+def keyset_clause(columns, values, desc):
+    """
+        return clause of the items after values (cursor) in order of keyset_order
+    """
+    if not columns[0].nullable:
+        return tuple_(*columns) < tuple_(*values) if desc else tuple_(*columns) > tuple_(*values)
+    first, rest, value, rest_values = columns[0], columns[1:], values[0], values[1:]
+    after_rest = tuple_(*rest) < tuple_(*rest_values) if desc else tuple_(*rest) > tuple_(*rest_values)
+    if value is None:
+        if desc:
+            return and_(first.is_(None), after_rest)
+        return or_(first.is_not(None), and_(first.is_(None), after_rest))
+    after = or_(first < value, and_(first == value, after_rest)) if desc else or_(first > value, and_(first == value, after_rest))
+    if desc:
+        return or_(after, first.is_(None))
+    return after
+
+
+def version_columns(cls):
+    version = inspect(cls).version_id_col
+    if version is None:
+        return []
+    return [version]
+
+
+def version_tag(cls, items):
+    """
+        return etag from url, identity and version of items, None if cls has not version column
+    """
+    mapper = inspect(cls)
+    if mapper.version_id_col is None:
+        return None
+    attribute = mapper.get_property_by_column(mapper.version_id_col).key
+    return hashlib.sha1(repr([request.full_path, request.headers.get('Accept')] + [(inspect(item).identity, getattr(item, attribute)) for item in items]).encode()).hexdigest()
+
+
+def relationship_target(cls, relationship):
+    if relationship not in inspect(cls).relationships:
+        raise ValueError("%s is not a relationship of %s" % (relationship, cls.__name__))
+    return inspect(cls).relationships[relationship].mapper.class_
+
+
+def relation_statement(statement, cls, relationship):
+    """
+        restrict statement on target of relationship to the item of cls with key bindparam parent_<column>
+    """
+    prop = inspect(cls).relationships[relationship]
+    keys = list(getConstraint(cls).columns)
+    if prop.secondary is None and all(local in keys for local, remote in prop.local_remote_pairs):
+        return statement.where(*[remote == bindparam('parent_%s' % local.name) for local, remote in prop.local_remote_pairs])
+    return statement.select_from(cls).join(prop.class_attribute).where(*[column == bindparam('parent_%s' % column.name) for column in keys])
 
 
 class ItemNotFound(Exception):
@@ -45,23 +516,31 @@ def requestBody(obj, method):
         for c in [c for c in obj.__table__.columns if c.autoincrement is not True and 'not create by api' not in str(c.comment)]:
             content["application/json"]["schema"]["properties"][c.name] = {"type": SQLTYPE_TO_SWAGGERTYPE.get(c.type.__class__, 'string')}
             if c.type.__class__ == Enum:
-                content["application/json"]["schema"]["properties"][c.name]["enum"] = [member for member in c]
+                content["application/json"]["schema"]["properties"][c.name]["enum"] = list(c.type.enums)
+        obj = content["application/json"]["schema"]
+        content = {"application/json": {"schema": {"oneOf": [obj, {"type": "array", "items": obj}]}}}
         return content
-    if method in ["PUT", "PATCH"]:
+    if method in ["PUT", "PATCH", "PATCH_ALL"]:
         for c in [c for c in obj.__table__.columns if 'not update by api' not in str(c.comment)]:
             content["application/json"]["schema"]["properties"][c.name] = {"type": SQLTYPE_TO_SWAGGERTYPE.get(c.type.__class__, 'string')}
             if c.type.__class__ == Enum:
-                content["application/json"]["schema"]["properties"][c.name]["enum"] = [member for member in c]
+                content["application/json"]["schema"]["properties"][c.name]["enum"] = list(c.type.enums)
         return content
     return None
 
 
 def responseBody(obj, method):
     content = {"application/json": {"schema": {"type": "object", "properties": {}}}}
+    if method == 'AGGREGATE':
+        return {"application/json": {"schema": {"type": "array", "items": {"type": "object"}}}}
+    if method in ('PATCH_ALL', 'DELETE_ALL'):
+        for name, kind in (("code", "integer"), ("message", "string"), ("count", "integer"), ("instance", "string")):
+            content["application/json"]["schema"]["properties"][name] = {"type": kind}
+        return content
     for c in [c for c in obj.__table__.columns if 'not visible by api' not in str(c.comment)]:
         content["application/json"]["schema"]["properties"][c.name] = {"type": SQLTYPE_TO_SWAGGERTYPE.get(c.type.__class__, 'string')}
         if c.type.__class__ == Enum:
-            content["application/json"]["schema"]["properties"][c.name]["enum"] = [member for member in c]
+            content["application/json"]["schema"]["properties"][c.name]["enum"] = list(c.type.enums)
     if method == 'ALL':
         obj = content["application/json"]["schema"]
         content = {"application/json": {"schema": {"type": "array", "items": obj}}}
@@ -69,6 +548,17 @@ def responseBody(obj, method):
 
 
 def error_api(func):
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def decorated_async_view(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except UnmappedInstanceError as err:
+                return {"code": 400, 'description': 'Item not found, %s' % str(err)}, 400
+            except Exception as err:
+                return {"code": 400, 'description': str(err)}, 400
+        return decorated_async_view
+
     @wraps(func)
     def decorated_view(*args, **kwargs):
         try:
@@ -80,32 +570,220 @@ def error_api(func):
     return decorated_view
 
 
+def closing_stream(chunks, session):
+    try:
+        yield from chunks
+    finally:
+        session.close()
+
+
+def sync_view(func):
+    """
+        return sync view which runs the async view func with the event loop of Flask (ensure_sync)
+    """
+    @wraps(func)
+    def view(*args, **kwargs):
+        return current_app.ensure_sync(func)(*args, **kwargs)
+    return view
+
+
 def multi_decorators(decorators):
     def decorator(f):
         for d in reversed(decorators):
-            f = d(f)
+            decorated = d(f)
+            if iscoroutinefunction(f) and not iscoroutinefunction(decorated):
+                # sync decorator of an async view (AsyncApiRest): it would return the coroutine, it decorates a sync view
+                decorated = d(sync_view(f))
+            f = decorated
         return f
     return decorator
 
 
 class ApiRest(Blueprint):
 
-    def __init__(self, db, name='apirest', import_name=__name__, url_prefix='/api/v1', *args, **kwargs):
+    yield_per = 500
+    raw_filter = True
+    etag = False
+    cache = None
+    fast_write = False
+    compress = False
+    compress_encodings = ('zstd', 'gzip', 'deflate')
+    compress_min_size = 1024
+    expand_depth = 2
+    metrics = None
+    total_count = None
+    query_check = None
+    query_budget = None
+    query_repeat = 10
+
+    def __init__(self, db, name='apirest', import_name=__name__, url_prefix='/api/v1', *args, json_backend=None, **kwargs):
         Blueprint.__init__(self, name, import_name, url_prefix, *args, **kwargs)
         self._db = db
         self._url_prefix = url_prefix
+        self.json_backend = json_backend
+        self.after_request(self._compress)
+        self.statements = LRUCache(maxsize=512, ttl=float('inf'))
+        self._swagger_paths = []
+        self._swagger = None
+        self._swagger_body = None
+        self._swagger_info = None
+        self.query_budgets = {}
+        self.counts = LRUCache(maxsize=1024, ttl=60)
+
+    def register_models(self, model, methods=('ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH'), decorators=[], exclude=()):
+        """
+            add apis of methods for all models mapped on the registry of model (db.Model), models without key are skipped
 
-    def add_api(self, cls, method, decorators=[], endpoint=None, serialize=model_to_dict):
+            the swagger of these apis is built on first use of ApiRest.swagger, return list of models
+        """
+        models = []
+        for mapper in sorted(model.registry.mappers, key=lambda mapper: mapper.class_.__name__):
+            cls = mapper.class_
+            if cls in exclude or getattr(cls, '__table__', None) is None or mapper.inherits is not None:
+                continue
+            if not any(isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint)) for constraint in cls.__table__.constraints):
+                continue
+            for method in methods:
+                self.add_api(cls, method, decorators, swagger=False)
+            models.append(cls)
+        return models
+
+    @property
+    def swagger(self):
+        """
+            Swagger of all apis, built on first use and after a new api
+        """
+        if self._swagger is None:
+            swagger = Swagger() if self._swagger_info is None else Swagger(**{key: value for key, value in self._swagger_info.items() if key != "paths"})
+            for path in self._swagger_paths:
+                swagger.addEndPoint(self._swagger_path(*path))
+            self._swagger = swagger
+            self._swagger_body = None
+        return self._swagger
+
+    def swagger_json(self):
+        """
+            return response of swagger in json, serialized once
+        """
+        swagger = self.swagger
+        if self._swagger_body is None:
+            self._swagger_body = json.dumps(swagger)
+        return Response(self._swagger_body, 200, mimetype=JSON)
+
+    def add_swagger(self, endpoint=None, swagger=None):
+        """
+            add url of swagger json (default url_prefix/swagger.json), swagger (Swagger) gives title, description, version and url
+        """
+        if endpoint is None:
+            endpoint = '%s/swagger.json' % self._url_prefix
+        self._swagger_info = swagger
+        self._swagger = None
+        self.add_url_rule(endpoint, 'swagger_%s' % endpoint[1:].replace('.', '_'), self.swagger_json, methods=['GET', ])
+
+    def add_metrics(self, endpoint=None):
+        """
+            add url of metrics in Prometheus text format (default url_prefix/metrics), ApiRest.metrics must be a Metrics
+        """
+        if endpoint is None:
+            endpoint = '%s/metrics' % self._url_prefix
+        self.add_url_rule(endpoint, 'metrics_%s' % endpoint[1:].replace('.', '_'), lambda: Response(self.metrics.render(), 200, content_type=CONTENT_TYPE), methods=['GET', ])
+
+    def _measured(self, func):
+        """
+            decorator of views which records the request in ApiRest.metrics and checks its queries if ApiRest.query_check
+            (nothing if metrics and query_check are None)
+        """
+        def start():
+            listen_engines()
+            timer = RequestTimer(shapes=self.query_check is not None)
+            return timer, current_timer.set(timer)
+
+        def stop(timer, token, status):
+            current_timer.reset(token)
+            if self.metrics is not None:
+                self.metrics.observe(request.url_rule.rule, request.method, status, timer)
+
+        def finish(timer, result):
+            if self.query_check is not None:
+                self._check_queries(timer)
+            with timer.phase('serialize'):
+                return current_app.make_response(result)
+
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def decorated_async_view(*args, **kwargs):
+                if self.metrics is None and self.query_check is None:
+                    return await func(*args, **kwargs)
+                timer, token = start()
+                status = 500
+                try:
+                    response = finish(timer, await func(*args, **kwargs))
+                    status = response.status_code
+                    return response
+                except HTTPException as err:
+                    status = err.code
+                    raise
+                finally:
+                    stop(timer, token, status)
+            return decorated_async_view
+
+        @wraps(func)
+        def decorated_view(*args, **kwargs):
+            if self.metrics is None and self.query_check is None:
+                return func(*args, **kwargs)
+            timer, token = start()
+            status = 500
+            try:
+                response = finish(timer, func(*args, **kwargs))
+                status = response.status_code
+                return response
+            except HTTPException as err:
+                status = err.code
+                raise
+            finally:
+                stop(timer, token, status)
+        return decorated_view
+
+    def _check_queries(self, timer):
+        """
+            warn (query_check 'warn') or raise QueryBudgetExceeded (query_check 'raise') if the request is over its query
+            budget or repeats a statement query_repeat times (N+1, lazy loads by serialize for example)
+
+            the check runs after the view: a write api is committed, so it only warns (an error would hide the write)
+        """
+        budget = self.query_budgets.get((request.url_rule.rule, request.method), self.query_budget)
+        problems = []
+        if budget is not None and timer.statements > budget:
+            problems.append("%s SQL statements, budget is %s" % (timer.statements, budget))
+        for shape, count in timer.shapes.items():
+            if count >= self.query_repeat:
+                problems.append("statement executed %s times (N+1): %s" % (count, shape))
+        if len(problems) > 0:
+            message = "%s %s: %s" % (request.method, request.url_rule.rule, '; '.join(problems))
+            if self.query_check == 'raise' and request.method in ('GET', 'HEAD'):
+                raise QueryBudgetExceeded(message)
+            logging.getLogger(__name__).warning(message)
+
+    def add_api(self, cls, method, decorators=[], endpoint=None, serialize=model_to_dict, stream=False, relationship=None, swagger=True, query_budget=None):
         _origin_method = method
-        decorators = [error_api,] + decorators
-        if method not in ['ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH']:
-            raise "%s is not a method value (ALL, POST, GET, DELETE, PUT, PATCH)" % method
-        if method == 'ALL':
+        decorators = [self._measured, error_api] + decorators
+        if method not in ['ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH', 'PATCH_ALL', 'DELETE_ALL', 'AGGREGATE']:
+            raise "%s is not a method value (ALL, POST, GET, DELETE, PUT, PATCH, PATCH_ALL, DELETE_ALL, AGGREGATE)" % method
+        target = cls if relationship is None else relationship_target(cls, relationship)
+        if serialize is model_to_dict:
+            serialize = serializer_plan(target)
+        if method == 'ALL' and relationship is not None:
+            method = 'GET'
+            parameters = getConstraint(cls)
+            if endpoint is None:
+                endpoint = '%s/%s/%s/%s' % (self._url_prefix, cls.__name__.lower(), unique_endpoint(cls), relationship)
+            self.add_url_rule(endpoint, 'view_%s' % endpoint[1:], multi_decorators(decorators)(self._relation(cls, relationship, serialize)), methods=[method, ])
+        elif method == 'ALL':
             method = 'GET'
             parameters = []
             if endpoint is None:
                 endpoint = '%s/%ss' % (self._url_prefix, cls.__name__.lower())
-            self.add_url_rule(endpoint, 'view_%ss' % endpoint[1:], multi_decorators(decorators)(self._all(cls, serialize)), methods=[method, ])
+            self.add_url_rule(endpoint, 'view_%ss' % endpoint[1:], multi_decorators(decorators)(self._all(cls, serialize, stream)), methods=[method, ])
         elif method == 'POST':
             parameters = []
             if endpoint is None:
@@ -131,89 +809,623 @@ class ApiRest(Blueprint):
             if endpoint is None:
                 endpoint = '%s/%s/%s' % (self._url_prefix, cls.__name__.lower(), unique_endpoint(cls))
             self.add_url_rule(endpoint, 'patch_%s' % endpoint[1:], multi_decorators(decorators)(self._patch(cls, serialize)), methods=[method, ])
+        elif method == 'PATCH_ALL':
+            method = 'PATCH'
+            parameters = []
+            if endpoint is None:
+                endpoint = '%s/%ss' % (self._url_prefix, cls.__name__.lower())
+            self.add_url_rule(endpoint, 'patchall_%s' % endpoint[1:], multi_decorators(decorators)(self._patch_all(cls, serialize)), methods=[method, ])
+        elif method == 'DELETE_ALL':
+            method = 'DELETE'
+            parameters = []
+            if endpoint is None:
+                endpoint = '%s/%ss' % (self._url_prefix, cls.__name__.lower())
+            self.add_url_rule(endpoint, 'delall_%s' % endpoint[1:], multi_decorators(decorators)(self._del_all(cls, serialize)), methods=[method, ])
+        elif method == 'AGGREGATE':
+            method = 'GET'
+            parameters = []
+            if endpoint is None:
+                endpoint = '%s/%ss/aggregate' % (self._url_prefix, cls.__name__.lower())
+            self.add_url_rule(endpoint, 'agg_%s' % endpoint[1:], multi_decorators(decorators)(self._aggregate(cls, serialize)), methods=[method, ])
         logging.getLogger("werkzeug").info(" * add url rule %s for %s" % (endpoint, method))
+        if query_budget is not None:
+            self.query_budgets[(endpoint, method)] = query_budget
+        path = (cls, target, method, _origin_method, endpoint, tuple(parameters), relationship)
+        self._swagger_paths.append(path)
+        self._swagger = None
+        if swagger:
+            return self._swagger_path(*path)
+
+    def _swagger_path(self, cls, target, method, _origin_method, endpoint, parameters, relationship):
         if endpoint.startswith(self._url_prefix):
             endpoint = endpoint[len(self._url_prefix):]
-        if endpoint.split("/")[-1] == unique_endpoint(cls):
-            endpoint = endpoint.split("/")[:-1] + ["{%s}" % endpoint.split("/")[-1].split(":")[1][:-1], ]
-            endpoint = "/".join(endpoint)
-        swagger = {"paths": {endpoint: {method.lower(): {"tags": [cls.__name__,], "summary": "", "description": "", "operationId": "%s_%s" % (cls.__name__.lower(), method), "parameters": []}}}}
+        endpoint = re.sub(r'<(?:[^:<>]+:)?([^<>]+)>', r'{\1}', endpoint)
+        operation = _origin_method if relationship is None else '%s_%s' % (_origin_method, relationship)
+        swagger = {"paths": {endpoint: {method.lower(): {"tags": [cls.__name__,], "summary": "", "description": "", "operationId": "%s_%s" % (cls.__name__.lower(), operation), "parameters": []}}}}
         for column in parameters:
             parameter = {"name": column.name, "in": "path", "description": "", "required": True, "schema": {"type": SQLTYPE_TO_SWAGGERTYPE.get(column.type.__class__, 'string')}}
             swagger["paths"][endpoint][method.lower()]["parameters"].append(parameter)
         if method in ('POST', 'PUT', 'PATCH'):
             swagger["paths"][endpoint][method.lower()]["requestBody"] = {"description": "", "content": requestBody(cls, _origin_method)}
         swagger["paths"][endpoint][method.lower()]["responses"] = {}
-        swagger["paths"][endpoint][method.lower()]["responses"]["200"] = {"description": "Successful operation", "content": responseBody(cls, _origin_method)}
+        swagger["paths"][endpoint][method.lower()]["responses"]["200"] = {"description": "Successful operation", "content": responseBody(target, _origin_method)}
         swagger["paths"][endpoint][method.lower()]["responses"]["400"] = {"description": "Error operation"}
         return swagger
 
-    def _all(self, cls, serialize):
+    @property
+    def json_backend(self):
+        return self._json
+
+    @json_backend.setter
+    def json_backend(self, value):
+        self._json = get_json_backend(value)
+
+    def _dumps(self):
+        if self._json is None:
+            return None
+        return self._json.dumps
+
+    def _loads(self, data):
+        with phase('parse'):
+            if self._json is None:
+                return json.loads(data)
+            return self._json.loads(data)
+
+    def _compress(self, response):
+        if not self.compress:
+            return response
+        return compress_response(response, self.compress_encodings, self.compress_min_size)
+
+    def _if_none_match(self, tag):
+        """
+            return the etag of header If-None-Match matching tag (tag of body, or with suffix of the content encoding the
+            response would have), None if no etag matches
+        """
+        if tag in request.if_none_match:
+            return tag
+        if self.compress:
+            encoding = negotiate_encoding(self.compress_encodings)
+            if encoding is not None and encoded_etag(tag, encoding) in request.if_none_match:
+                return encoded_etag(tag, encoding)
+        return None
+
+    def _json_response(self, data, status):
+        add_rows(len(data) if isinstance(data, list) else 1)
+        if self._json is None:
+            return data, status
+        return self._json.dumps(data), status, {'Content-Type': JSON}
+
+    def _session(self):
+        return self._db.session
+
+    def _raw_filter(self):
+        filter = request.args.get('filter', '')
+        if len(filter.strip()) == 0:
+            return []
+        if not self.raw_filter:
+            raise ValueError("parameter filter is not allowed, use column__operator=value")
+        return [text(filter)]
+
+    def _filters(self, cls):
+        """
+            return clauses from structured filter and from raw sql parameter filter (if raw_filter is True)
+        """
+        return structured_filter(cls, request.args) + self._raw_filter()
+
+    def _bulk_filters(self, cls):
+        """
+            return clauses from structured filter only (PATCH_ALL and DELETE_ALL), raise ValueError on parameter filter
+            and on any parameter which is not column__operator=value (an ignored parameter would widen the selection)
+        """
+        if len(request.args.get('filter', '').strip()) > 0:
+            raise ValueError("parameter filter is not allowed for %s, use column__operator=value" % request.path)
+        for key in request.args:
+            if '__' not in key or key.rsplit('__', 1)[1] not in FILTER_OPERATORS:
+                raise ValueError("parameter %s is not a filter column__operator=value for %s" % (key, request.path))
+        return structured_filter(cls, request.args)
+
+    def _statement(self, cls, key, build):
+        """
+            return statement from cache of statements (hits and misses are counted by self.statements), build it on miss
+
+            the model of cache is the mapped class: classes of single table inheritance share a table, not their statements
+        """
+        statement = self.statements.get(cls, key)
+        if statement is None:
+            statement = build()
+            self.statements.set(cls, key, statement)
+        return statement
+
+    def _key_statement(self, cls, kws, plan=None, columns=(), expand=None):
+        """
+            return cached statement (key lookup with bindparam) and parameters for item from kws
+        """
+        def build():
+            statement = select(cls).where(*[getattr(cls, kw) == bindparam('key_%s' % kw) for kw in sorted(kws)])
+            if plan is not None:
+                statement = statement.options(plan.load_only(*columns))
+            if expand is not None:
+                statement = statement.options(*expand.options)
+            return statement
+        statement = self._statement(cls, ('one', tuple(sorted(kws)), None if plan is None else tuple(plan.keys), None if expand is None else expand.key), build)
+        return statement, {'key_%s' % kw: kws[kw] for kw in kws}
+
+    def _one_or_404(self, cls, kws, plan=None, columns=(), expand=None):
+        """
+            return item from kws with a cached statement, abort 404 if not found
+        """
+        statement, params = self._key_statement(cls, kws, plan, columns, expand)
+        try:
+            return self._session().execute(statement, params).unique().scalar_one()
+        except (NoResultFound, MultipleResultsFound):
+            abort(404, description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
+
+    def _list_statement(self, cls, order_by, plan, columns=(), parent=None, relationship=None, expand=None):
+        """
+            return statement and parameters for the list of ALL api, cached if the parameter filter is not used
+
+            with parent and relationship, the list is the items of relationship for the parent (parameters parent_<column>)
+        """
+        filters = parse_filter(cls, request.args)
+        raw = self._raw_filter()
+
+        def build():
+            statement = select(cls)
+            if parent is not None:
+                statement = relation_statement(statement, parent, relationship)
+            statement = statement.where(*(filter_clauses(cls, filters, bind=True) + raw)).order_by(*order_by_clauses(cls, order_by, self.raw_filter)).offset(bindparam('offset')).limit(bindparam('limit'))
+            if plan is not None:
+                statement = statement.options(plan.load_only(*columns))
+            if expand is not None:
+                statement = statement.options(*expand.options)
+            return statement
+        if len(raw) > 0:
+            return build(), filter_params(filters)
+        shape = tuple((name, operator, value if operator == 'isnull' else None) for name, operator, value in filters)
+        return self._statement(cls, ('all', shape, order_by, None if plan is None else tuple(plan.keys), None if parent is None else (parent, relationship), None if expand is None else expand.key), build), filter_params(filters)
+
+    def _total_count(self, cls, filters, raw):
+        """
+            return headers X-Total-Count of the items of filters and raw (with X-Total-Count-Estimated if the count comes from
+            statistics of database), count is cached in self.counts (key is model and filters) and invalidated by write apis
+        """
+        # statistics of database count the table: all classes of single table inheritance
+        estimated = self.total_count == 'estimated' and len(filters) == 0 and len(raw) == 0 and not inspect(cls).single
+        # model of cache is the table (invalidated by writes of all classes of the table), key has the class
+        key = (cls, estimated, tuple((name, operator, tuple(value) if isinstance(value, list) else value) for name, operator, value in filters), request.args.get('filter', '') if len(raw) > 0 else '')
+        count = self.counts.get(cls.__table__.name, key)
+        if count is None:
+            if estimated:
+                count = estimated_count(self._session(), cls)
+                estimated = count is not None
+            if count is None:
+                def build():
+                    return select(func.count()).select_from(cls).where(*(filter_clauses(cls, filters, bind=True) + raw))
+                if len(raw) > 0:
+                    statement = build()
+                else:
+                    statement = self._statement(cls, ('count', tuple((name, operator, value if operator == 'isnull' else None) for name, operator, value in filters)), build)
+                count = self._session().execute(statement, filter_params(filters)).scalar()
+            self.counts.set(cls.__table__.name, key, (count, estimated))
+        else:
+            count, estimated = count
+        headers = {'X-Total-Count': str(count)}
+        if estimated:
+            headers['X-Total-Count-Estimated'] = 'true'
+        return headers
+
+    def _invalidate(self, cls):
+        """
+            invalidate cache of cls and of models linked by relationships (relationship lists and expand embed cls)
+        """
+        self.counts.invalidate(cls.__table__.name)
+        if self.cache is not None:
+            for table in related_tables(cls, max(1, self.expand_depth)):
+                self.cache.invalidate(table)
+
+    def _cache_lookup(self, cls):
+        """
+            return key and response from cache (key is model and query args), response is None if not in cache
+        """
+        key = (request.path, negotiate()) + tuple(sorted(request.args.items(multi=True)))
+        result = self.cache.get(cls.__table__.name, key)
+        if result is not None and len(result) > 2 and 'ETag' in result[2]:
+            match = self._if_none_match(result[2]['ETag'][1:-1])
+            if match is not None:
+                return key, ('', 304, {'ETag': '"%s"' % match})
+        return key, result
+
+    def _cache_store(self, cls, key, result):
+        if result[1] == 200:
+            self.cache.set(cls.__table__.name, key, result)
+        return result
+
+    def _cached(self, cls, fct):
+        """
+            return response of fct from cache, fct response is cached if status is 200
+        """
+        if self.cache is None:
+            return fct()
+        key, result = self._cache_lookup(cls)
+        if result is None:
+            return self._cache_store(cls, key, fct())
+        return result
+
+    def _response(self, cls, items, data, status, headers=None):
+        """
+            return response of data (callable) encoded for header Accept, with etag and 304 for If-None-Match if etag is active
+
+            items are the loaded items of data (for the version tag), None if data is not made of items
+        """
+        mimetype = negotiate()
+        if items is not None:
+            add_rows(len(items))
+        if not self.etag and mimetype == JSON and self._json is None:
+            with phase('serialize'):
+                result = data()
+            if headers is None:
+                return result, status
+            return result, status, headers
+        tag = None
+        if self.etag and items is not None and not request.args.get('expand'):
+            # embedded objects are not in the version tag, the tag of an expanded response is the hash of body
+            tag = version_tag(cls, items)
+            match = None if tag is None else self._if_none_match(tag)
+            if match is not None:
+                return '', 304, {'ETag': '"%s"' % match}
+        with phase('serialize'):
+            body = encode(mimetype, data(), self._dumps())
+        headers = dict(headers or {})
+        if self.etag:
+            if tag is None:
+                tag = hashlib.sha1(body if isinstance(body, bytes) else body.encode()).hexdigest()
+                match = self._if_none_match(tag)
+                if match is not None:
+                    return '', 304, {'ETag': '"%s"' % match}
+            headers['ETag'] = '"%s"' % tag
+        headers['Content-Type'] = mimetype if mimetype != CSV else '%s; charset=utf-8' % CSV
+        headers['Vary'] = 'Accept'
+        return body, status, headers
+
+    def _all(self, cls, serialize, stream=False):
+        keys = list(getConstraint(cls).columns)
+        converters = [column_converter(column) for column in keys]
+        versioned = version_columns(cls)
+        mapper = inspect(cls)
+
+        def fct_cursor(cursor, limit, order_by, filters, plan, expand, serialize):
+            columns, desc = keyset_columns(cls, keys, order_by)
+            statement = select(cls).where(*filters)
+            if plan is not None:
+                statement = statement.options(plan.load_only(*(columns + versioned)))
+            if expand is not None:
+                statement = statement.options(*expand.options)
+            if len(cursor) > 0:
+                statement = statement.where(keyset_clause(columns, decode_cursor(order_by, cursor, columns), desc))
+            items = self._session().scalars(statement.order_by(*keyset_order(columns, desc)).limit(int(limit))).all()
+            headers = {}
+            if len(items) == int(limit):
+                token = encode_cursor(order_by, [getattr(items[-1], mapper.get_property_by_column(column).key) for column in columns])
+                args = request.args.to_dict()
+                args['cursor'] = token
+                headers['X-Next-Cursor'] = token
+                headers['Link'] = '<%s?%s>; rel="next"' % (request.base_url, urlencode(args))
+            return self._response(cls, items, lambda: [serialize(item) for item in items], 200, headers)
+
+        def fct_ids(ids, limit, plan, expand, serialize):
+            values = []
+            for value in ids.split(','):
+                if len(value.split('/')) != len(keys):
+                    raise ValueError("%s is not a key of %s" % (value, cls.__name__))
+                values.append(tuple(convert(part) for convert, part in zip(converters, value.split('/'))))
+            if len(values) > int(limit):
+                raise ValueError("too many ids (limit %s)" % limit)
+            def build():
+                statement = select(cls).where(tuple_(*keys).in_(bindparam('ids', expanding=True)) if len(keys) > 1 else keys[0].in_(bindparam('ids', expanding=True)))
+                if plan is not None:
+                    statement = statement.options(plan.load_only(*versioned))
+                if expand is not None:
+                    statement = statement.options(*expand.options)
+                return statement
+            statement = self._statement(cls, ('ids', None if plan is None else tuple(plan.keys), None if expand is None else expand.key), build)
+            items = self._session().scalars(statement, {'ids': values if len(keys) > 1 else [value[0] for value in values]}).all()
+            found = {tuple(getattr(item, mapper.get_property_by_column(column).key) for column in keys): item for item in items}
+            return self._response(cls, items, lambda: [serialize(found[value]) if value in found else None for value in values], 200)
+
+        def fct_list(statement, params, serialize):
+            items = self._session().scalars(statement, params).all()
+            headers = None
+            if self.total_count is not None:
+                headers = self._total_count(cls, parse_filter(cls, request.args), self._raw_filter())
+            return self._response(cls, items, lambda: [serialize(item) for item in items], 200, headers)
+
         def fct():
-            offset = request.args.get('offset', 0)
-            limit = request.args.get('limit', 999)
+            if request.method == 'HEAD' and self.total_count is not None:
+                return '', 200, self._total_count(cls, parse_filter(cls, request.args), self._raw_filter())
+            offset = int(request.args.get('offset', 0))
+            limit = int(request.args.get('limit', 999))
             order_by = request.args.get('orderby', '')
-            filter = request.args.get('filter', '')
-            return [serialize(item) for item in cls.query.filter(text(filter)).order_by(text(order_by)).offset(offset).limit(limit).all()], 200
+            cursor = request.args.get('cursor')
+            ids = request.args.get('ids')
+            plan, fields_serialize = projection(cls, serialize, request.args.get('fields'))
+            expand, fields_serialize = expansion(cls, fields_serialize, request.args.get('expand'), self.expand_depth)
+            if ids is not None:
+                return self._cached(cls, lambda: fct_ids(ids, limit, plan, expand, fields_serialize))
+            if cursor is not None:
+                filters = self._filters(cls)
+                return self._cached(cls, lambda: fct_cursor(cursor, limit, order_by, filters, plan, expand, fields_serialize))
+            statement, params = self._list_statement(cls, order_by, plan, versioned, expand=expand)
+            params['offset'] = offset
+            params['limit'] = limit
+            if stream:
+                # dedicated session: the scoped session is removed on teardown, before the body is sent
+                session = self._db.session.session_factory()
+                try:
+                    items = session.scalars(statement.execution_options(yield_per=self.yield_per), params)
+                except Exception:
+                    session.close()
+                    raise
+                mimetype = negotiate()
+                headers = {'Vary': 'Accept'}
+                if self.total_count is not None:
+                    headers.update(self._total_count(cls, parse_filter(cls, request.args), self._raw_filter()))
+                return Response(stream_with_context(closing_stream(STREAMS[mimetype](items, fields_serialize, self.yield_per, self._dumps()), session)), 200, mimetype=mimetype, headers=headers)
+            return self._cached(cls, lambda: fct_list(statement, params, fields_serialize))
+        return fct
+
+    def _relation(self, cls, relationship, serialize):
+        target = relationship_target(cls, relationship)
+        versioned = version_columns(target)
+
+        def fct_list(statement, params, serialize):
+            items = self._session().scalars(statement, params).all()
+            return self._response(target, items, lambda: [serialize(item) for item in items], 200)
+
+        def fct(**kws):
+            offset = int(request.args.get('offset', 0))
+            limit = int(request.args.get('limit', 999))
+            order_by = request.args.get('orderby', '')
+            plan, fields_serialize = projection(target, serialize, request.args.get('fields'))
+            expand, fields_serialize = expansion(target, fields_serialize, request.args.get('expand'), self.expand_depth)
+            statement, params = self._list_statement(target, order_by, plan, versioned, cls, relationship, expand)
+            params.update({'parent_%s' % kw: kws[kw] for kw in kws})
+            params['offset'] = offset
+            params['limit'] = limit
+            return self._cached(target, lambda: fct_list(statement, params, fields_serialize))
         return fct
 
     def _post(self, cls, serialize):
+        excluded = [c.name for c in cls.__table__.columns if c.autoincrement is True or 'not create by api' in str(c.comment)]
+        keys = list(getConstraint(cls).columns)
+        mapper = inspect(cls)
+        attributes = {c.name: mapper.get_property_by_column(c).key for c in cls.__table__.columns}
+        autoincrement = None
+        if len(keys) == 1 and cls.__table__.autoincrement_column is keys[0]:
+            autoincrement = attributes[keys[0].name]
+
+        def fct_bulk(items):
+            values = []
+            for dct in items:
+                if not isinstance(dct, dict):
+                    raise ValueError("item %s is not an object" % dct)
+                for col in dct:
+                    if col not in attributes:
+                        raise ValueError("%s is not a column of %s" % (col, cls.__name__))
+                values.append({attributes[col]: dct[col] for col in dct if col not in excluded})
+            if len(values) == 0:
+                return [], 201
+            returning = [getattr(cls, attributes[c.name]) for c in keys]
+            groups = {}
+            for index, value in enumerate(values):
+                groups.setdefault(tuple(value), []).append(index)
+            rows = [None] * len(values)
+            # one executemany by columns of items
+            for names, indexes in groups.items():
+                group = [values[index] for index in indexes]
+                if all(attributes[c.name] in names for c in keys):
+                    self._session().execute(insert(cls), group)
+                    result = [tuple(value[attributes[c.name]] for c in keys) for value in group]
+                elif autoincrement is not None:
+                    # one batch of insertmanyvalues: the generated keys increase in the order of items
+                    result = sorted(self._session().execute(insert(cls).returning(*returning), group).all())
+                else:
+                    # sentinel needed to map rows to items (one statement by item on databases without sentinel)
+                    result = self._session().execute(insert(cls).returning(*returning, sort_by_parameter_order=True), group).all()
+                for index, row in zip(indexes, result):
+                    rows[index] = row
+            self._session().commit()
+            self._invalidate(cls)
+            return self._json_response([{c.name: row[i] for i, c in enumerate(keys)} for row in rows], 201)
+
         def fct(**kws):
             dct = {key: request.form.get(key) for key in request.form}
             if len(dct) == 0:
-                dct = json.loads(request.get_data())
-            for col in [c.name for c in cls.__table__.columns if c.autoincrement is True]:
-                if col in dct:
-                    del dct[col]
-            for col in [c.name for c in cls.__table__.columns if 'not create by api' in str(c.comment)]:
+                dct = self._loads(request.get_data())
+            if isinstance(dct, list):
+                return fct_bulk(dct)
+            for col in excluded:
                 if col in dct:
                     del dct[col]
             item = cls(**dct)
-            self._db.session.add(item)
-            self._db.session.commit()
-            return serialize(item), 201
+            self._session().add(item)
+            self._session().commit()
+            self._invalidate(cls)
+            return self._json_response(serialize(item), 201)
         return fct
 
     def _get(self, cls, serialize):
+        versioned = version_columns(cls)
+
         def fct(**kws):
-            item = self._db.one_or_404(self._db.select(cls).filter_by(**kws), description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
-            return serialize(item), 200
+            plan, fields_serialize = projection(cls, serialize, request.args.get('fields'))
+            expand, fields_serialize = expansion(cls, fields_serialize, request.args.get('expand'), self.expand_depth)
+            item = self._one_or_404(cls, kws, plan, versioned, expand)
+            return self._response(cls, [item], lambda: fields_serialize(item), 200)
         return fct
 
+    def _fast_update(self, cls, serialize, kws, values):
+        """
+            update item with a single UPDATE ... RETURNING, abort 404 if no row is updated
+        """
+        if len(values) == 0:
+            return self._json_response(serialize(self._one_or_404(cls, kws)), 200)
+        version = inspect(cls).version_id_col
+        if version is not None:
+            values[inspect(cls).get_property_by_column(version).key] = version + 1
+        statement = update(cls).filter_by(**kws).values(values).returning(cls).execution_options(synchronize_session=False, populate_existing=True)
+        item = self._session().execute(statement).scalars().first()
+        if item is None:
+            self._session().rollback()
+            abort(404, description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
+        # serialize before commit, commit expires item
+        result = serialize(item)
+        self._session().commit()
+        self._invalidate(cls)
+        return self._json_response(result, 200)
+
     def _del(self, cls, serialize):
+        keys = [getattr(cls, inspect(cls).get_property_by_column(c).key) for c in getConstraint(cls).columns]
+
+        def fct_fast(**kws):
+            row = self._session().execute(delete(cls).filter_by(**kws).returning(*keys).execution_options(synchronize_session=False)).first()
+            if row is None:
+                self._session().rollback()
+                abort(404, description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
+            self._session().commit()
+            self._invalidate(cls)
+            return {"code": 200, "message": "element remove with success", "instance": request.path}, 200
+
         def fct(**kws):
-            item = self._db.one_or_404(self._db.select(cls).filter_by(**kws), description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
-            self._db.session.delete(item)
-            self._db.session.commit()
+            if self.fast_write:
+                return fct_fast(**kws)
+            item = self._one_or_404(cls, kws)
+            self._session().delete(item)
+            self._session().commit()
+            self._invalidate(cls)
             return {"code": 200, "message": "element remove with success", "instance": request.path}, 200
         return fct
 
     def _put(self, cls, serialize):
+        keys = [c.name for c in getConstraint(cls).columns]
+        mapper = inspect(cls)
+        attributes = {c.name: mapper.get_property_by_column(c).key for c in cls.__table__.columns if c.name not in keys and 'not update by api' not in str(c.comment)}
+
+        def fct_fast(**kws):
+            dct = {key: request.form.get(key) for key in request.form}
+            if len(dct) == 0:
+                dct = self._loads(request.get_data())
+            return self._fast_update(cls, serialize, kws, {attributes[col]: dct.get(col) for col in attributes})
+
         def fct(**kws):
-            item = self._db.one_or_404(self._db.select(cls).filter_by(**kws), description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
+            if self.fast_write:
+                return fct_fast(**kws)
+            item = self._one_or_404(cls, kws)
             dct = {key: request.form.get(key) for key in request.form}
             if len(dct) == 0:
-                dct = json.loads(request.get_data())
+                dct = self._loads(request.get_data())
             for key in kws:
                 dct[key] = kws[key]
             for col in [c.name for c in item.__table__.columns if 'not update by api' not in str(c.comment)]:
                 item.__setattr__(col, dct.get(col))
-            self._db.session.commit()
-            return serialize(item), 200
+            self._session().commit()
+            self._invalidate(cls)
+            return self._json_response(serialize(item), 200)
         return fct
 
     def _patch(self, cls, serialize):
+        keys = [c.name for c in getConstraint(cls).columns]
+        mapper = inspect(cls)
+        attributes = {c.name: mapper.get_property_by_column(c).key for c in cls.__table__.columns if c.name not in keys and 'not update by api' not in str(c.comment)}
+
+        def fct_fast(**kws):
+            dct = {key: request.form.get(key) for key in request.form}
+            if len(dct) == 0:
+                dct = self._loads(request.get_data())
+            return self._fast_update(cls, serialize, kws, {attributes[col]: dct[col] for col in dct if col in attributes})
+
         def fct(**kws):
-            item = self._db.one_or_404(self._db.select(cls).filter_by(**kws), description=f"{cls.__name__} with parameters {','.join(['%s:%s' % (kw, kws[kw]) for kw in kws])}.")
+            if self.fast_write:
+                return fct_fast(**kws)
+            item = self._one_or_404(cls, kws)
             dct = {key: request.form.get(key) for key in request.form}
             if len(dct) == 0:
-                dct = json.loads(request.get_data())
+                dct = self._loads(request.get_data())
             for key in kws:
                 dct[key] = kws[key]
             for col in [key for key in dct if key in item.__table__.columns and 'not update by api' not in str(item.__table__.columns[key].comment)]:
                 item.__setattr__(col, dct.get(col))
-            self._db.session.commit()
-            return serialize(item), 200
+            self._session().commit()
+            self._invalidate(cls)
+            return self._json_response(serialize(item), 200)
+        return fct
+
+    def _aggregate(self, cls, serialize):
+        def fct_aggregate(statement, params, names, converters):
+            rows = self._session().execute(statement, params).all()
+            add_rows(len(rows))
+            return self._response(cls, None, lambda: [{name: value if convert is None or value is None else convert(value) for name, convert, value in zip(names, converters, row)} for row in rows], 200)
+
+        def fct():
+            offset = int(request.args.get('offset', 0))
+            limit = int(request.args.get('limit', 999))
+            groupby = request.args.get('groupby', '')
+            agg = request.args.get('agg', 'count(*)')
+            columns, aggregates = parse_aggregate(cls, groupby, agg)
+            filters = parse_filter(cls, request.args)
+            raw = self._raw_filter()
+
+            def build():
+                selected = columns + [AGGREGATE_FUNCTIONS[function]() if column is None else AGGREGATE_FUNCTIONS[function](column) for name, function, column in aggregates]
+                statement = select(*selected).select_from(cls).where(*(filter_clauses(cls, filters, bind=True) + raw))
+                if len(columns) > 0:
+                    statement = statement.group_by(*columns).order_by(*columns)
+                return statement.offset(bindparam('offset')).limit(bindparam('limit'))
+            if len(raw) > 0:
+                statement = build()
+            else:
+                shape = tuple((name, operator, value if operator == 'isnull' else None) for name, operator, value in filters)
+                statement = self._statement(cls, ('aggregate', tuple(column.name for column in columns), tuple(name for name, function, column in aggregates), shape), build)
+            params = filter_params(filters)
+            params['offset'] = offset
+            params['limit'] = limit
+            names = [column.name for column in columns] + [name for name, function, column in aggregates]
+            converters = [_converter(column) for column in columns] + [None if column is None or function == 'count' or (function == 'avg' and not isinstance(column.type, Numeric)) else _converter(column) for name, function, column in aggregates]
+            return self._cached(cls, lambda: fct_aggregate(statement, params, names, converters))
+        return fct
+
+    def _patch_all(self, cls, serialize):
+        keys = [c.name for c in getConstraint(cls).columns]
+        mapper = inspect(cls)
+        attributes = {c.name: mapper.get_property_by_column(c).key for c in cls.__table__.columns if c.name not in keys and 'not update by api' not in str(c.comment)}
+
+        def fct():
+            filters = self._bulk_filters(cls)
+            if len(filters) == 0:
+                raise ValueError("parameter column__operator=value is mandatory for %s" % request.path)
+            dct = {key: request.form.get(key) for key in request.form}
+            if len(dct) == 0:
+                dct = self._loads(request.get_data())
+            values = {attributes[key]: dct[key] for key in dct if key in attributes}
+            if len(values) == 0:
+                raise ValueError("no column to update for %s" % cls.__name__)
+            version = mapper.version_id_col
+            if version is not None:
+                values[mapper.get_property_by_column(version).key] = version + 1
+            result = self._session().execute(update(cls).where(*filters).values(values).execution_options(synchronize_session=False))
+            self._session().commit()
+            self._invalidate(cls)
+            return {"code": 200, "message": "elements update with success", "count": result.rowcount, "instance": request.path}, 200
+        return fct
+
+    def _del_all(self, cls, serialize):
+        def fct():
+            filters = self._bulk_filters(cls)
+            if len(filters) == 0:
+                raise ValueError("parameter column__operator=value is mandatory for %s" % request.path)
+            result = self._session().execute(delete(cls).where(*filters).execution_options(synchronize_session=False))
+            self._session().commit()
+            self._invalidate(cls)
+            return {"code": 200, "message": "elements remove with success", "count": result.rowcount, "instance": request.path}, 200
         return fct
 
     def register(self, app, options):
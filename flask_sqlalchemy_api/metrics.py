@@ -0,0 +1,203 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from bisect import bisect_left
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import threading
+import time
+import re
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 1000)
+
+current_timer = ContextVar('current_timer', default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    """
+        Request over the query budget or with a repeated statement (N+1) when ApiRest.query_check is 'raise'
+    """
+
+
+def statement_shape(statement):
+    """
+        return statement with lists of parameters (IN) reduced to one parameter
+    """
+    return re.sub(r'\(\?(?:, \?)+\)', '(?)', ' '.join(statement.split()))
+
+
+class RequestTimer(object):
+    """
+        Measures of one request: time by phase (parse, query, serialize), SQL statements and rows
+
+        with shapes, count of each statement shape (for N+1 detection)
+    """
+
+    def __init__(self, shapes=False):
+        self.start = time.perf_counter()
+        self.phases = {'parse': 0.0, 'query': 0.0, 'serialize': 0.0}
+        self.statements = 0
+        self.rows = 0
+        self.shapes = {} if shapes else None
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+
+@contextmanager
+def phase(name):
+    """
+        add the time of block to phase name of the current request (nothing if metrics are not active)
+    """
+    timer = current_timer.get()
+    if timer is None:
+        yield
+    else:
+        with timer.phase(name):
+            yield
+
+
+def add_rows(count):
+    timer = current_timer.get()
+    if timer is not None:
+        timer.rows += count
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_timer.get() is not None:
+        conn.info.setdefault('api_query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timer = current_timer.get()
+    if timer is not None and len(conn.info.get('api_query_start', [])) > 0:
+        timer.phases['query'] += time.perf_counter() - conn.info['api_query_start'].pop()
+        timer.statements += 1
+        # batches of executemany (insertmanyvalues) are one statement by design, not a N+1
+        if timer.shapes is not None and not executemany:
+            shape = statement_shape(statement)
+            timer.shapes[shape] = timer.shapes.get(shape, 0) + 1
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and len(conn.info.get('api_query_start', [])) > 0:
+        start = conn.info['api_query_start'].pop()
+        timer = current_timer.get()
+        if timer is not None:
+            timer.phases['query'] += time.perf_counter() - start
+
+
+_listening = []
+
+
+def listen_engines():
+    """
+        count statements and query time of all engines for the current request (events are added once)
+    """
+    if len(_listening) == 0:
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+        _listening.append(True)
+
+
+class Histogram(object):
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield '%s_bucket{%s,le="%s"} %s' % (name, labels, bucket, cumulative)
+        yield '%s_bucket{%s,le="+Inf"} %s' % (name, labels, self.count)
+        yield '%s_sum{%s} %s' % (name, labels, self.sum)
+        yield '%s_count{%s} %s' % (name, labels, self.count)
+
+
+def _labels(**labels):
+    return ','.join('%s="%s"' % (key, str(value).replace('\\', '\\\\').replace('"', '\\"')) for key, value in labels.items())
+
+
+class Metrics(object):
+    """
+        Metrics of apis by endpoint (url rule) and method, rendered in Prometheus text format
+
+        requests and errors (status >= 400, also the errors returned by error_api), latency histograms by phase
+        (parse: json body, query: SQL execution, serialize: serializer and encoding, total), rows returned and SQL
+        statements by request
+    """
+
+    def __init__(self, prefix='flask_sqlalchemy_api', buckets=DURATION_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._errors = {}
+        self._rows = {}
+        self._durations = {}
+        self._statements = {}
+        listen_engines()
+
+    def observe(self, endpoint, method, status, timer):
+        total = time.perf_counter() - timer.start
+        key = (endpoint, method)
+        with self._lock:
+            self._requests[key + (status,)] = self._requests.get(key + (status,), 0) + 1
+            if status >= 400:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            self._rows[key] = self._rows.get(key, 0) + timer.rows
+            for name, value in list(timer.phases.items()) + [('total', total)]:
+                histogram = self._durations.get(key + (name,))
+                if histogram is None:
+                    histogram = self._durations[key + (name,)] = Histogram(self.buckets)
+                histogram.observe(value)
+            histogram = self._statements.get(key)
+            if histogram is None:
+                histogram = self._statements[key] = Histogram(COUNT_BUCKETS)
+            histogram.observe(timer.statements)
+
+    def render(self):
+        """
+            return metrics in Prometheus text format
+        """
+        prefix = self.prefix
+        lines = []
+        with self._lock:
+            lines.append('# HELP %s_requests_total Requests by endpoint, method and status.' % prefix)
+            lines.append('# TYPE %s_requests_total counter' % prefix)
+            for (endpoint, method, status), value in sorted(self._requests.items()):
+                lines.append('%s_requests_total{%s} %s' % (prefix, _labels(endpoint=endpoint, method=method, status=status), value))
+            lines.append('# HELP %s_errors_total Responses with status >= 400 by endpoint and method.' % prefix)
+            lines.append('# TYPE %s_errors_total counter' % prefix)
+            for (endpoint, method), value in sorted(self._errors.items()):
+                lines.append('%s_errors_total{%s} %s' % (prefix, _labels(endpoint=endpoint, method=method), value))
+            lines.append('# HELP %s_rows_total Rows returned by endpoint and method.' % prefix)
+            lines.append('# TYPE %s_rows_total counter' % prefix)
+            for (endpoint, method), value in sorted(self._rows.items()):
+                lines.append('%s_rows_total{%s} %s' % (prefix, _labels(endpoint=endpoint, method=method), value))
+            lines.append('# HELP %s_request_duration_seconds Latency by endpoint, method and phase.' % prefix)
+            lines.append('# TYPE %s_request_duration_seconds histogram' % prefix)
+            for (endpoint, method, name), histogram in sorted(self._durations.items()):
+                lines.extend(histogram.lines('%s_request_duration_seconds' % prefix, _labels(endpoint=endpoint, method=method, phase=name)))
+            lines.append('# HELP %s_sql_statements SQL statements by request.' % prefix)
+            lines.append('# TYPE %s_sql_statements histogram' % prefix)
+            for (endpoint, method), histogram in sorted(self._statements.items()):
+                lines.extend(histogram.lines('%s_sql_statements' % prefix, _labels(endpoint=endpoint, method=method)))
+        return '\n'.join(lines) + '\n'
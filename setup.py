@@ -42,6 +42,7 @@ setup(
     long_description_content_type='text/markdown',
     include_package_data=True,
     install_requires=REQUIRED,
+    extras_require={'msgpack': ['msgpack'], 'orjson': ['orjson'], 'zstd': ['zstandard']},
     url=URLPKG,
     classifiers=CLASSIFIED,
     entry_points={},
@@ -0,0 +1,77 @@
+import unittest
+import enum
+import datetime
+import decimal
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api, model_to_dict, serializer_plan
+
+
+class Status(enum.Enum):
+    open = 1
+    close = 2
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            secret = db.Column(db.String, nullable=True, comment="not visible by api")
+            status = db.Column(db.Enum(Status), nullable=True)
+            price = db.Column(db.Numeric(10, 2), nullable=True)
+            created = db.Column(db.DateTime, nullable=True)
+
+        apiManager = ApiRest(db)
+        for method in ['ALL', 'GET']:
+            apiManager.add_api(Todo, method)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(Todo(title='test', secret='secret', status=Status.open, price=decimal.Decimal('1.50'), created=datetime.datetime(2024, 1, 2, 3, 4, 5)))
+            db.session.add(Todo(title='empty'))
+            db.session.commit()
+        self.Todo = Todo
+        self.db = db
+
+    def test_plan(self):
+        plan = serializer_plan(self.Todo)
+        self.assertIs(plan, serializer_plan(self.Todo))
+        self.assertEqual(plan.keys, ['id', 'title', 'status', 'price', 'created'])
+
+    def test_get_item(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todo/1')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(result, {'id': 1, 'title': 'test', 'status': 'open', 'price': '1.50', 'created': 'Tue, 02 Jan 2024 03:04:05 GMT'})
+
+    def test_get_items(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(len(result), 2)
+            self.assertEqual(result[1], {'id': 2, 'title': 'empty', 'status': None, 'price': None, 'created': None})
+
+    def test_model_to_dict(self):
+        with self.app.app_context():
+            item = self.db.session.get(self.Todo, 1)
+            self.assertEqual(model_to_dict(item)['status'], 'open')
+            self.assertTrue('secret' not in model_to_dict(item))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        apiManager = ApiRest(db)
+        apiManager.yield_per = 10
+        apiManager.add_api(Todo, 'ALL', stream=True)
+        apiManager.add_api(Todo, 'POST')
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+
+    def test_get_null(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(rv.mimetype, 'application/json')
+            self.assertEqual(json.loads(rv.data), [])
+
+    def test_get_items(self):
+        with self.app.test_client() as c:
+            todo = {'title': 'test', 'description': 'test description', 'status': 'test'}
+            for i in range(0, 25):
+                rv = c.post('/api/v1/todo', data=todo)
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(len(result), 25)
+            self.assertEqual(result[24]['id'], 25)
+            rv = c.get('/api/v1/todos?offset=5&limit=10&orderby=id%20desc')
+            result = json.loads(rv.data)
+            self.assertEqual([item['id'] for item in result], list(range(20, 10, -1)))
+
+    def test_get_filter_error(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?filter=unknown%3D1')
+            self.assertEqual(rv.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import datetime
+import enum
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+
+
+class Color(enum.Enum):
+    red = 3
+    blue = 1
+    green = 2
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        class Event(db.Model):
+            __tablename__ = 'event'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            created = db.Column(db.DateTime, nullable=False)
+            color = db.Column(db.Enum(Color), nullable=False)
+
+        apiManager = ApiRest(db)
+        for method in ['ALL', 'POST']:
+            apiManager.add_api(Todo, method)
+        apiManager.add_api(Event, 'ALL')
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(0, 25):
+                db.session.add(Todo(title='title %s' % (i % 3), description='test description', status='test' if i < 20 else 'close'))
+            for i in range(0, 7):
+                db.session.add(Event(created=datetime.datetime(2024, 1, 1 + i // 2, 10), color=list(Color)[i % 3]))
+            db.session.commit()
+
+    def walk(self, c, url):
+        ids = []
+        pages = 0
+        while url is not None and pages < 50:
+            rv = c.get(url)
+            self.assertEqual(rv.status_code, 200)
+            ids = ids + [item['id'] for item in json.loads(rv.data)]
+            pages = pages + 1
+            url = None
+            if 'Link' in rv.headers:
+                url = rv.headers['Link'].split(';')[0][1:-1]
+        return ids, pages
+
+    def test_cursor_key(self):
+        with self.app.test_client() as c:
+            ids, pages = self.walk(c, '/api/v1/todos?cursor=&limit=10')
+            self.assertEqual(ids, list(range(1, 26)))
+            self.assertEqual(pages, 3)
+
+    def test_cursor_order_by(self):
+        with self.app.test_client() as c:
+            ids, pages = self.walk(c, '/api/v1/todos?cursor=&limit=4&orderby=title%20desc')
+            self.assertEqual(len(ids), 25)
+            rv = c.get('/api/v1/todos?orderby=title%20desc%2Cid%20desc')
+            self.assertEqual(ids, [item['id'] for item in json.loads(rv.data)])
+
+    def test_cursor_filter(self):
+        with self.app.test_client() as c:
+            ids, pages = self.walk(c, '/api/v1/todos?cursor=&limit=2&filter=status%3D%27close%27')
+            self.assertEqual(ids, list(range(21, 26)))
+
+    def test_cursor_null(self):
+        with self.app.test_client() as c:
+            for i in range(0, 6):
+                c.post('/api/v1/todo', json={'title': 'null %s' % i, 'status': None if i < 3 else 'null %s' % (i % 2)})
+            rv = c.get('/api/v1/todos?status__isnull=true')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [26, 27, 28])
+            for orderby in ('status', 'status%20desc'):
+                ids, pages = self.walk(c, '/api/v1/todos?cursor=&limit=2&orderby=%s&filter=id%%3E25' % orderby)
+                self.assertEqual(sorted(ids), list(range(26, 32)))
+            ids, pages = self.walk(c, '/api/v1/todos?cursor=&limit=2&orderby=status&filter=id%3E25')
+            self.assertEqual(ids[:3], [26, 27, 28])
+            ids, pages = self.walk(c, '/api/v1/todos?cursor=&limit=2&orderby=status%20desc&filter=id%3E25')
+            self.assertEqual(ids[3:], [28, 27, 26])
+
+    def test_cursor_datetime(self):
+        with self.app.test_client() as c:
+            for orderby in ('created', 'created%20desc'):
+                ids, pages = self.walk(c, '/api/v1/events?cursor=&limit=2&orderby=%s' % orderby)
+                self.assertEqual(sorted(ids), list(range(1, 8)))
+                self.assertEqual(pages, 4)
+            ids, pages = self.walk(c, '/api/v1/events?cursor=&limit=3&orderby=created%20desc')
+            self.assertEqual(ids, [7, 6, 5, 4, 3, 2, 1])
+
+    def test_cursor_enum(self):
+        with self.app.test_client() as c:
+            ids, pages = self.walk(c, '/api/v1/events?cursor=&limit=2&orderby=color')
+            rv = c.get('/api/v1/events?orderby=color%2Cid')
+            self.assertEqual(ids, [item['id'] for item in json.loads(rv.data)])
+            self.assertEqual(len(ids), 7)
+
+    def test_cursor_error(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?cursor=&orderby=unknown')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?cursor=&limit=2')
+            cursor = rv.headers['X-Next-Cursor']
+            rv = c.get('/api/v1/todos?limit=2&orderby=title&cursor=%s' % cursor)
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?cursor=bad')
+            self.assertEqual(rv.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api, serializer_plan
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True, comment="not visible by api")
+
+        self.Todo = Todo
+        apiManager = ApiRest(db)
+        for method in ['ALL', 'GET']:
+            apiManager.add_api(Todo, method)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(0, 3):
+                db.session.add(Todo(title='title %s' % i, description='test description', status='test'))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_get_items(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?fields=title')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), [{'title': 'title 0'}, {'title': 'title 1'}, {'title': 'title 2'}])
+            self.assertTrue('description' not in self.statements[-1])
+
+    def test_get_items_cursor(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?fields=id&cursor=&limit=2&orderby=title%20desc')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), [{'id': 3}, {'id': 2}])
+            self.assertTrue('X-Next-Cursor' in rv.headers)
+
+    def test_get_item(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todo/2?fields=id,description')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), {'id': 2, 'description': 'test description'})
+            self.assertTrue('title' not in self.statements[-1])
+
+    def test_fields_not_visible(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?fields=status')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todo/1?fields=unknown')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?fields=id,title,id')
+            self.assertEqual(rv.status_code, 400)
+
+    def test_fields_cache(self):
+        plan = serializer_plan(self.Todo)
+        self.assertIs(plan.project(['id', 'title']), plan.project(('id', 'title')))
+        self.assertEqual(plan.project(['title', 'id']).keys, ['title', 'id'])
+        self.assertRaises(ValueError, plan.project, ['id'] * 1000)
+        self.assertEqual(plan._projections.maxsize, 128)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True, comment="not create by api")
+
+        class Note(db.Model):
+            __tablename__ = 'note'
+            id = db.Column(db.Integer, primary_key=True)
+            title = db.Column(db.String, nullable=False)
+
+        apiManager = ApiRest(db)
+        for method in ['ALL', 'POST']:
+            apiManager.add_api(Todo, method)
+            apiManager.add_api(Note, method)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_post_bulk(self):
+        with self.app.test_client() as c:
+            todos = [{'title': 'test %s' % i, 'description': 'test description', 'status': 'test', 'id': 99} for i in range(0, 100)]
+            rv = c.post('/api/v1/todo', json=todos)
+            self.assertEqual(rv.status_code, 201)
+            self.assertEqual(json.loads(rv.data), [{'id': i} for i in range(1, 101)])
+            self.assertEqual(len([statement for statement in self.statements if statement.startswith('INSERT')]), 1)
+            rv = c.get('/api/v1/todos')
+            result = json.loads(rv.data)
+            self.assertEqual(len(result), 100)
+            self.assertEqual(result[99], {'id': 100, 'title': 'test 99', 'description': 'test description', 'status': None})
+
+    def test_post_bulk_order(self):
+        with self.app.test_client() as c:
+            c.post('/api/v1/todo', json=[{'title': 'first'}])
+            todos = [{'title': 'test %s' % i} if i % 2 == 0 else {'title': 'test %s' % i, 'description': 'odd'} for i in range(0, 6)]
+            rv = c.post('/api/v1/todo', json=todos)
+            self.assertEqual(rv.status_code, 201)
+            keys = [item['id'] for item in json.loads(rv.data)]
+            rv = c.get('/api/v1/todos?id__gt=1')
+            titles = {item['id']: item['title'] for item in json.loads(rv.data)}
+            self.assertEqual([titles[key] for key in keys], [todo['title'] for todo in todos])
+
+    def test_post_bulk_keys(self):
+        with self.app.test_client() as c:
+            notes = [{'title': 'note %s' % i} if i % 2 == 0 else {'title': 'note %s' % i, 'id': 100 + i} for i in range(0, 10)]
+            rv = c.post('/api/v1/note', json=notes)
+            self.assertEqual(rv.status_code, 201)
+            keys = [item['id'] for item in json.loads(rv.data)]
+            self.assertEqual(keys[1::2], [101, 103, 105, 107, 109])
+            self.assertEqual(len([statement for statement in self.statements if statement.startswith('INSERT')]), 2)
+            rv = c.get('/api/v1/notes')
+            titles = {item['id']: item['title'] for item in json.loads(rv.data)}
+            self.assertEqual([titles[key] for key in keys], [note['title'] for note in notes])
+
+    def test_post_bulk_empty(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', json=[])
+            self.assertEqual(rv.status_code, 201)
+            self.assertEqual(json.loads(rv.data), [])
+
+    def test_post_bulk_error(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', json=[{'title': 'test'}, {'unknown': 'test'}])
+            self.assertEqual(rv.status_code, 400)
+            rv = c.post('/api/v1/todo', json=[{'title': 'test'}, {'description': 'no title'}])
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(json.loads(rv.data), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False, comment="not update by api")
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        apiManager = ApiRest(db)
+        for method in ['ALL', 'PATCH_ALL', 'DELETE_ALL']:
+            apiManager.add_api(Todo, method)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(0, 10):
+                db.session.add(Todo(title='title %s' % i, description='test description', status='open' if i < 6 else 'close'))
+            db.session.commit()
+
+    def test_patch_all(self):
+        with self.app.test_client() as c:
+            rv = c.patch('/api/v1/todos?status__eq=close', json={'status': 'archived', 'title': 'change', 'id': 99})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data)['count'], 4)
+            rv = c.get('/api/v1/todos?filter=status%3D%27archived%27')
+            result = json.loads(rv.data)
+            self.assertEqual([item['id'] for item in result], [7, 8, 9, 10])
+            self.assertEqual(result[0]['title'], 'title 6')
+
+    def test_delete_all(self):
+        with self.app.test_client() as c:
+            rv = c.delete('/api/v1/todos?status__eq=open&id__gt=2')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data)['count'], 4)
+            rv = c.get('/api/v1/todos')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [1, 2, 7, 8, 9, 10])
+
+    def test_filter_mandatory(self):
+        with self.app.test_client() as c:
+            rv = c.delete('/api/v1/todos')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.patch('/api/v1/todos', json={'status': 'archived'})
+            self.assertEqual(rv.status_code, 400)
+            rv = c.patch('/api/v1/todos?id__gt=1', json={'title': 'change'})
+            self.assertEqual(rv.status_code, 400)
+
+    def test_raw_filter(self):
+        with self.app.test_client() as c:
+            rv = c.delete('/api/v1/todos?filter=1%3D1')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.patch('/api/v1/todos?filter=1%3D1&id__gt=0', json={'status': 'archived'})
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?status__eq=open')
+            self.assertEqual(len(json.loads(rv.data)), 6)
+
+    def test_unknown_filter(self):
+        with self.app.test_client() as c:
+            rv = c.delete('/api/v1/todos?status__eq=open&id__lte=2')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.patch('/api/v1/todos?status__eq=open&title__equals=x', json={'status': 'archived'})
+            self.assertEqual(rv.status_code, 400)
+            rv = c.delete('/api/v1/todos?status__eq=open&limit=2')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?status__eq=open')
+            self.assertEqual(len(json.loads(rv.data)), 6)
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(len(json.loads(rv.data)), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
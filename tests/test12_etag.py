@@ -0,0 +1,105 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api, model_to_dict
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+        self.serialized = 0
+
+        def myserialiser(obj):
+            self.serialized = self.serialized + 1
+            return model_to_dict(obj)
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        class Note(db.Model):
+            __tablename__ = 'note'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            version = db.Column(db.Integer, nullable=False)
+            __mapper_args__ = {"version_id_col": version}
+
+        apiManager = ApiRest(db)
+        apiManager.etag = True
+        for method in ['ALL', 'POST', 'GET', 'PATCH', 'PATCH_ALL']:
+            apiManager.add_api(Todo, method)
+            apiManager.add_api(Note, method, serialize=myserialiser)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+
+    def test_etag_item(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', data={'title': 'test'})
+            rv = c.get('/api/v1/todo/1')
+            self.assertEqual(rv.status_code, 200)
+            etag = rv.headers['ETag']
+            self.assertEqual(json.loads(rv.data)['title'], 'test')
+            rv = c.get('/api/v1/todo/1', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 304)
+            self.assertEqual(rv.data, b'')
+            rv = c.patch('/api/v1/todo/1', data={'title': 'change'})
+            rv = c.get('/api/v1/todo/1', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 200)
+            self.assertNotEqual(rv.headers['ETag'], etag)
+
+    def test_etag_items(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', data={'title': 'test'})
+            rv = c.get('/api/v1/todos')
+            etag = rv.headers['ETag']
+            rv = c.get('/api/v1/todos', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 304)
+            rv = c.get('/api/v1/todos?fields=id', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), [{'id': 1}])
+
+    def test_etag_version(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/note', data={'title': 'test'})
+            rv = c.get('/api/v1/notes')
+            etag = rv.headers['ETag']
+            self.serialized = 0
+            rv = c.get('/api/v1/notes', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 304)
+            rv = c.get('/api/v1/note/1')
+            etag = rv.headers['ETag']
+            rv = c.get('/api/v1/note/1', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 304)
+            self.assertEqual(self.serialized, 1)
+            rv = c.patch('/api/v1/note/1', data={'title': 'change'})
+            rv = c.get('/api/v1/note/1', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data)['version'], 2)
+
+    def test_etag_patch_all(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/note', data={'title': 'test'})
+            rv = c.get('/api/v1/notes')
+            etag = rv.headers['ETag']
+            rv = c.patch('/api/v1/notes?id__eq=1', json={'title': 'change'})
+            self.assertEqual(json.loads(rv.data)['count'], 1)
+            rv = c.get('/api/v1/notes', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), [{'id': 1, 'title': 'change', 'version': 2}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api, LRUCache
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        self.apiManager = ApiRest(db)
+        self.apiManager.cache = LRUCache(maxsize=2, ttl=60)
+        for method in ['ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH', 'PATCH_ALL', 'DELETE_ALL']:
+            self.apiManager.add_api(Todo, method)
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def selects(self):
+        return len([statement for statement in self.statements if statement.startswith('SELECT')])
+
+    def test_cache_hit(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', data={'title': 'test'})
+            rv = c.get('/api/v1/todos?limit=10&offset=0')
+            count = self.selects()
+            rv = c.get('/api/v1/todos?offset=0&limit=10')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(len(json.loads(rv.data)), 1)
+            self.assertEqual(self.selects(), count)
+            self.assertEqual(self.apiManager.cache.hits, 1)
+            rv = c.get('/api/v1/todos?offset=0&limit=5')
+            self.assertEqual(self.selects(), count + 1)
+
+    def test_cache_invalidate(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', data={'title': 'test'})
+            for write in (lambda: c.post('/api/v1/todo', data={'title': 'test'}),
+                          lambda: c.put('/api/v1/todo/1', data={'title': 'put'}),
+                          lambda: c.patch('/api/v1/todo/1', data={'title': 'patch'}),
+                          lambda: c.patch('/api/v1/todos?id__eq=1', data={'status': 'close'}),
+                          lambda: c.delete('/api/v1/todos?id__eq=2'),
+                          lambda: c.delete('/api/v1/todo/1')):
+                rv = c.get('/api/v1/todos')
+                before = json.loads(rv.data)
+                rv = write()
+                self.assertEqual(rv.status_code, 201 if rv.request.method == 'POST' else 200)
+                rv = c.get('/api/v1/todos')
+                self.assertNotEqual(json.loads(rv.data), before)
+            self.assertEqual(json.loads(rv.data), [])
+
+    def test_lru(self):
+        cache = LRUCache(maxsize=2, ttl=10, timer=lambda: self.now)
+        self.now = 0
+        cache.set('todo', 1, 'one')
+        cache.set('todo', 2, 'two')
+        self.assertEqual(cache.get('todo', 1), 'one')
+        cache.set('note', 3, 'three')
+        self.assertEqual(cache.get('todo', 2), None)
+        self.assertEqual(cache.get('todo', 1), 'one')
+        cache.invalidate('todo')
+        self.assertEqual(cache.get('todo', 1), None)
+        self.assertEqual(cache.get('note', 3), 'three')
+        self.now = 11
+        self.assertEqual(cache.get('note', 3), None)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
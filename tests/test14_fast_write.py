@@ -0,0 +1,94 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False, comment="not update by api")
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        class Note(db.Model):
+            __tablename__ = 'note'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            version = db.Column(db.Integer, nullable=False, comment="not update by api")
+            __mapper_args__ = {"version_id_col": version}
+
+        apiManager = ApiRest(db)
+        apiManager.fast_write = True
+        for method in ['ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH']:
+            apiManager.add_api(Todo, method)
+            apiManager.add_api(Note, method)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(Todo(title='test', description='test description', status='test'))
+            db.session.add(Note(title='test'))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_put(self):
+        with self.app.test_client() as c:
+            rv = c.put('/api/v1/todo/1', data={'title': 'change', 'description': 'change', 'id': 2})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), {'id': 1, 'title': 'test', 'description': 'change', 'status': None})
+            self.assertEqual(len(self.statements), 1)
+            self.assertTrue(self.statements[0].startswith('UPDATE'))
+
+    def test_patch(self):
+        with self.app.test_client() as c:
+            rv = c.patch('/api/v1/todo/1', data={'status': 'close'})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), {'id': 1, 'title': 'test', 'description': 'test description', 'status': 'close'})
+            self.assertEqual(len(self.statements), 1)
+            rv = c.get('/api/v1/todo/1')
+            self.assertEqual(json.loads(rv.data)['status'], 'close')
+
+    def test_patch_version(self):
+        with self.app.test_client() as c:
+            rv = c.patch('/api/v1/note/1', data={'title': 'change', 'version': 10})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), {'id': 1, 'title': 'change', 'version': 2})
+
+    def test_delete(self):
+        with self.app.test_client() as c:
+            rv = c.delete('/api/v1/todo/1')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(len(self.statements), 1)
+            self.assertTrue(self.statements[0].startswith('DELETE'))
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(json.loads(rv.data), [])
+
+    def test_not_found(self):
+        with self.app.test_client() as c:
+            rv = c.delete('/api/v1/todo/999')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.put('/api/v1/todo/999', data={'description': 'change'})
+            self.assertEqual(rv.status_code, 400)
+            rv = c.patch('/api/v1/todo/999', data={'description': 'change'})
+            self.assertEqual(rv.status_code, 400)
+            rv = c.patch('/api/v1/todo/999', data={'title': 'change'})
+            self.assertEqual(rv.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+from sqlalchemy import PrimaryKeyConstraint, event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+
+        class Item(db.Model):
+            __tablename__ = 'item'
+            id = db.Column(db.Integer)
+            code = db.Column(db.String)
+            title = db.Column(db.String, nullable=False)
+            __table_args__ = (
+                PrimaryKeyConstraint(id, code),
+                {},
+            )
+
+        apiManager = ApiRest(db)
+        apiManager.add_api(Todo, 'ALL')
+        apiManager.add_api(Item, 'ALL')
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 11):
+                db.session.add(Todo(title='title %s' % i))
+                db.session.add(Item(id=i, code='a', title='title %s' % i))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_ids(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?ids=5,99,2,5')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(result, [{'id': 5, 'title': 'title 5'}, None, {'id': 2, 'title': 'title 2'}, {'id': 5, 'title': 'title 5'}])
+            self.assertEqual(len(self.statements), 1)
+
+    def test_ids_fields(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?ids=3&fields=title')
+            self.assertEqual(json.loads(rv.data), [{'title': 'title 3'}])
+
+    def test_ids_composite(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/items?ids=3/a,3/b,1/a')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(result, [{'id': 3, 'code': 'a', 'title': 'title 3'}, None, {'id': 1, 'code': 'a', 'title': 'title 1'}])
+
+    def test_ids_error(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/items?ids=3')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?ids=a')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?ids=1,2,3&limit=2')
+            self.assertEqual(rv.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
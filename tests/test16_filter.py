@@ -0,0 +1,113 @@
+import unittest
+import datetime
+import decimal
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            done = db.Column(db.Boolean, nullable=True)
+            status = db.Column(db.String, nullable=True)
+            secret = db.Column(db.String, nullable=True, comment="not visible by api")
+
+        class Event(db.Model):
+            __tablename__ = 'event'
+            id = db.Column(db.BigInteger().with_variant(db.Integer, 'sqlite'), primary_key=True, autoincrement=True)
+            created = db.Column(db.DateTime, nullable=True)
+            day = db.Column(db.Date, nullable=True)
+            hour = db.Column(db.Time, nullable=True)
+            price = db.Column(db.Numeric(10, 2), nullable=True)
+            rank = db.Column(db.SmallInteger, nullable=True)
+
+        apiManager = ApiRest(db)
+        apiManager.raw_filter = False
+        for method in ['ALL', 'PATCH_ALL', 'DELETE_ALL']:
+            apiManager.add_api(Todo, method)
+        apiManager.add_api(Event, 'ALL')
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 11):
+                db.session.add(Todo(title='title %s' % i, done=i % 2 == 0, status='open' if i < 6 else None))
+                db.session.add(Event(created=datetime.datetime(2024, 1, i, 12), day=datetime.date(2024, 1, i), hour=datetime.time(i, 30),
+                                     price=decimal.Decimal('%s.50' % i), rank=i))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def ids(self, c, url):
+        rv = c.get(url)
+        self.assertEqual(rv.status_code, 200)
+        return [item['id'] for item in json.loads(rv.data)]
+
+    def test_operators(self):
+        with self.app.test_client() as c:
+            self.assertEqual(self.ids(c, '/api/v1/todos?id__gt=3&id__le=5'), [4, 5])
+            self.assertEqual(self.ids(c, '/api/v1/todos?id__in=1,3,20'), [1, 3])
+            self.assertEqual(self.ids(c, '/api/v1/todos?title__eq=title%202'), [2])
+            self.assertEqual(self.ids(c, '/api/v1/todos?title__like=title%201%25'), [1, 10])
+            self.assertEqual(self.ids(c, '/api/v1/todos?status__isnull=true&done__eq=true'), [6, 8, 10])
+            self.assertEqual(self.ids(c, '/api/v1/todos?status__ne=open'), [])
+            self.assertEqual(self.ids(c, '/api/v1/todos?id__lt=4&orderby=id%20desc'), [3, 2, 1])
+
+    def test_types(self):
+        with self.app.test_client() as c:
+            self.assertEqual(self.ids(c, '/api/v1/events?created__gt=2024-01-08'), [8, 9, 10])
+            self.assertEqual(self.ids(c, '/api/v1/events?created__ge=2024-01-09T12:00:00'), [9, 10])
+            self.assertEqual(self.ids(c, '/api/v1/events?day__lt=2024-01-03'), [1, 2])
+            self.assertEqual(self.ids(c, '/api/v1/events?hour__ge=09:00'), [9, 10])
+            self.assertEqual(self.ids(c, '/api/v1/events?price__gt=9.5'), [10])
+            self.assertEqual(self.ids(c, '/api/v1/events?rank__in=2,3&id__le=2'), [2])
+            rv = c.get('/api/v1/events?day__eq=tomorrow')
+            self.assertEqual(rv.status_code, 400)
+
+    def test_bound_parameters(self):
+        with self.app.test_client() as c:
+            self.ids(c, '/api/v1/todos?id__gt=3')
+            self.ids(c, '/api/v1/todos?id__gt=7')
+            self.assertEqual(self.statements[0], self.statements[1])
+
+    def test_errors(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?filter=id%3D2')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?secret__eq=a')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?id__gt=a')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?id__lte=2')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?title__equals=x')
+            self.assertEqual(rv.status_code, 400)
+            rv = c.get('/api/v1/todos?orderby=random()')
+            self.assertEqual(rv.status_code, 400)
+
+    def test_write(self):
+        with self.app.test_client() as c:
+            rv = c.patch('/api/v1/todos?id__ge=9', json={'status': 'close'})
+            self.assertEqual(json.loads(rv.data)['count'], 2)
+            rv = c.delete('/api/v1/todos?status__eq=close')
+            self.assertEqual(json.loads(rv.data)['count'], 2)
+            self.assertEqual(self.ids(c, '/api/v1/todos'), list(range(1, 9)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            status = db.Column(db.String, nullable=True)
+
+        class Employee(db.Model):
+            __tablename__ = 'employee'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            kind = db.Column(db.String, nullable=False)
+            __mapper_args__ = {'polymorphic_on': kind, 'polymorphic_identity': 'employee'}
+
+        class Manager(Employee):
+            __mapper_args__ = {'polymorphic_identity': 'manager'}
+
+        self.apiManager = ApiRest(db)
+        for method in ['ALL', 'GET', 'DELETE', 'PUT', 'PATCH']:
+            self.apiManager.add_api(Todo, method)
+        for method in ['ALL', 'GET']:
+            self.apiManager.add_api(Employee, method)
+            self.apiManager.add_api(Manager, method)
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 11):
+                db.session.add(Todo(title='title %s' % i, status='open' if i < 6 else 'close'))
+            db.session.add_all([Employee(name='employee 1'), Manager(name='manager 2'), Employee(name='employee 3')])
+            db.session.commit()
+
+    def test_key_lookup(self):
+        with self.app.test_client() as c:
+            for i in range(1, 6):
+                rv = c.get('/api/v1/todo/%s' % i)
+                self.assertEqual(json.loads(rv.data)['id'], i)
+            rv = c.patch('/api/v1/todo/6', data={'status': 'test'})
+            self.assertEqual(json.loads(rv.data)['status'], 'test')
+            rv = c.get('/api/v1/todo/99')
+            self.assertEqual(rv.status_code, 400)
+            self.assertEqual(self.apiManager.statements.misses, 1)
+            self.assertEqual(self.apiManager.statements.hits, 6)
+            rv = c.get('/api/v1/todo/1?fields=title')
+            self.assertEqual(self.apiManager.statements.misses, 2)
+
+    def test_single_table_inheritance(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/employees')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [1, 2, 3])
+            rv = c.get('/api/v1/managers')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [2])
+            rv = c.get('/api/v1/employee/2')
+            self.assertEqual(json.loads(rv.data)['name'], 'manager 2')
+            rv = c.get('/api/v1/manager/1')
+            self.assertEqual(rv.status_code, 400)
+
+    def test_list(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?status__eq=open&limit=2')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [1, 2])
+            rv = c.get('/api/v1/todos?status__eq=close&offset=1&limit=2')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [7, 8])
+            self.assertEqual(self.apiManager.statements.misses, 1)
+            self.assertEqual(self.apiManager.statements.hits, 1)
+            rv = c.get('/api/v1/todos?status__eq=close&orderby=id%20desc')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [10, 9, 8, 7, 6])
+            rv = c.get('/api/v1/todos?filter=id%3D1')
+            self.assertEqual(self.apiManager.statements.misses, 2)
+            self.assertEqual(self.apiManager.statements.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
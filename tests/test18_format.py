@@ -0,0 +1,82 @@
+import unittest
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api, LRUCache
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            status = db.Column(db.String, nullable=True)
+
+        apiManager = ApiRest(db)
+        apiManager.cache = LRUCache()
+        for method in ['ALL', 'GET']:
+            apiManager.add_api(Todo, method)
+        apiManager.add_api(Todo, 'ALL', endpoint='/api/v1/stream', stream=True)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(Todo(title='title, 1', status='open'))
+            db.session.add(Todo(title='title 2'))
+            db.session.commit()
+
+    def test_json(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos', headers={'Accept': 'text/html'})
+            self.assertEqual(rv.mimetype, 'application/json')
+            self.assertEqual(len(json.loads(rv.data)), 2)
+
+    def test_ndjson(self):
+        with self.app.test_client() as c:
+            for url in ('/api/v1/todos', '/api/v1/stream'):
+                rv = c.get(url, headers={'Accept': 'application/x-ndjson'})
+                self.assertEqual(rv.mimetype, 'application/x-ndjson')
+                self.assertEqual([json.loads(line) for line in rv.data.decode().splitlines()], [{'id': 1, 'title': 'title, 1', 'status': 'open'}, {'id': 2, 'title': 'title 2', 'status': None}])
+            rv = c.get('/api/v1/todos', headers={'Accept': 'application/json'})
+            self.assertEqual(len(json.loads(rv.data)), 2)
+
+    def test_csv(self):
+        with self.app.test_client() as c:
+            for url in ('/api/v1/todos', '/api/v1/stream'):
+                rv = c.get(url, headers={'Accept': 'text/csv'})
+                self.assertEqual(rv.mimetype, 'text/csv')
+                self.assertEqual(rv.data.decode(), 'id,title,status\r\n1,"title, 1",open\r\n2,title 2,\r\n')
+            rv = c.get('/api/v1/todo/2?fields=title', headers={'Accept': 'text/csv'})
+            self.assertEqual(rv.data.decode(), 'title\r\ntitle 2\r\n')
+            rv = c.get('/api/v1/todos?ids=99,1', headers={'Accept': 'text/csv'})
+            self.assertEqual(rv.data.decode(), 'id,title,status\r\n\r\n1,"title, 1",open\r\n')
+            rv = c.get('/api/v1/todos?ids=99,98', headers={'Accept': 'text/csv'})
+            self.assertEqual(rv.data.decode(), '\r\n\r\n')
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos', headers={'Accept': 'application/msgpack'})
+            self.assertEqual(rv.mimetype, 'application/msgpack')
+            self.assertEqual(msgpack.unpackb(rv.data), [{'id': 1, 'title': 'title, 1', 'status': 'open'}, {'id': 2, 'title': 'title 2', 'status': None}])
+            rv = c.get('/api/v1/todo/1', headers={'Accept': 'application/msgpack'})
+            self.assertEqual(msgpack.unpackb(rv.data)['id'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
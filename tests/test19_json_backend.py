@@ -0,0 +1,109 @@
+import unittest
+import datetime
+import decimal
+import enum
+import uuid
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api, model_to_dict
+from flask_sqlalchemy_api.formats import StdJson, OrJson, orjson
+
+
+class Status(enum.Enum):
+    open = 1
+    close = 2
+
+
+def myserialiser(obj):
+    serialize = model_to_dict(obj)
+    serialize["uuid"] = uuid.UUID(int=obj.id)
+    serialize["date"] = datetime.date(2024, 1, 2)
+    serialize["price"] = decimal.Decimal('1.50')
+    serialize["states"] = [Status.open, {'last': Status.close}]
+    return serialize
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    backend = 'json'
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            status = db.Column(db.Enum(Status), nullable=True)
+
+        apiManager = ApiRest(db, json_backend=self.backend)
+        for method in ['ALL', 'POST', 'GET', 'PUT', 'PATCH']:
+            apiManager.add_api(Todo, method, serialize=myserialiser)
+        apiManager.add_api(Todo, 'ALL', endpoint='/api/v1/stream', stream=True)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+
+    def test_classic(self):
+        with self.app.test_client() as c:
+            rv = c.post('/api/v1/todo', data=json.dumps({'title': 'test', 'status': 'open'}))
+            self.assertEqual(rv.status_code, 201)
+            self.assertEqual(rv.mimetype, 'application/json')
+            check = {'id': 1, 'title': 'test', 'status': 'open', 'uuid': '00000000-0000-0000-0000-000000000001', 'date': '2024-01-02', 'price': '1.50',
+                     'states': ['open', {'last': 'close'}]}
+            self.assertEqual(json.loads(rv.data), check)
+            rv = c.patch('/api/v1/todo/1', data=json.dumps({'status': 'close'}))
+            check['status'] = 'close'
+            self.assertEqual(json.loads(rv.data), check)
+            rv = c.get('/api/v1/todo/1')
+            self.assertEqual(rv.mimetype, 'application/json')
+            self.assertEqual(json.loads(rv.data), check)
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(json.loads(rv.data), [check])
+
+    def test_backend(self):
+        backend = StdJson()
+        self.assertEqual(backend.dumps({'a': Status.open, 'b': datetime.datetime(2024, 1, 2, 3, 4)}), '{"a":"open","b":"2024-01-02T03:04:00"}')
+        self.assertEqual(backend.loads('[1]'), [1])
+        self.assertRaises(TypeError, backend.dumps, object())
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class OrJsonTest(BasicTest):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api with orjson
+    """
+    def setUp(self):
+        # myserialiser adds Enum values: names need enum_names
+        self.backend = OrJson(enum_names=True)
+        BasicTest.setUp(self)
+
+    def test_enum(self):
+        self.assertEqual(OrJson().dumps({'a': Status.open, 'b': datetime.date(2024, 1, 2)}), b'{"a":1,"b":"2024-01-02"}')
+        backend = OrJson(enum_names=True)
+        self.assertEqual(backend.dumps({'a': Status.open, 'b': [Status.close], 'c': (1, Status.open)}), b'{"a":"open","b":["close"],"c":[1,"open"]}')
+
+    def test_formats(self):
+        with self.app.test_client() as c:
+            c.post('/api/v1/todo', json={'title': 'test', 'status': 'open'})
+            c.post('/api/v1/todo', json={'title': 'test 2'})
+            rv = c.get('/api/v1/todos', headers={'Accept': 'application/x-ndjson'})
+            self.assertEqual([json.loads(line)['id'] for line in rv.data.decode().splitlines()], [1, 2])
+            rv = c.get('/api/v1/todos')
+            self.assertEqual([item['id'] for item in json.loads(rv.data)], [1, 2])
+            rv = c.get('/api/v1/stream')
+            self.assertEqual(json.loads(rv.data), [{'id': 1, 'title': 'test', 'status': 'open'}, {'id': 2, 'title': 'test 2', 'status': None}])
+            rv = c.get('/api/v1/stream', headers={'Accept': 'application/x-ndjson'})
+            self.assertEqual(rv.data.decode().splitlines()[1], '{"id":2,"title":"test 2","status":null}')
+
+
+if __name__ == '__main__':
+    unittest.main()
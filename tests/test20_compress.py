@@ -0,0 +1,92 @@
+import unittest
+import gzip
+import zlib
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, error_api
+from flask_sqlalchemy_api.compress import zstandard
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+
+        apiManager = ApiRest(db)
+        apiManager.compress = True
+        apiManager.etag = True
+        apiManager.yield_per = 10
+        for method in ['ALL', 'GET']:
+            apiManager.add_api(Todo, method)
+        apiManager.add_api(Todo, 'ALL', endpoint='/api/v1/stream', stream=True)
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 101):
+                db.session.add(Todo(title='title %s' % i, description='test description'))
+            db.session.commit()
+
+    def test_gzip(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos', headers={'Accept-Encoding': 'gzip'})
+            self.assertEqual(rv.headers['Content-Encoding'], 'gzip')
+            self.assertTrue('Accept-Encoding' in rv.headers['Vary'])
+            self.assertEqual(len(json.loads(gzip.decompress(rv.data))), 100)
+
+    def test_etag(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos')
+            identity = rv.headers['ETag']
+            rv = c.get('/api/v1/todos', headers={'Accept-Encoding': 'gzip'})
+            self.assertEqual(rv.headers['Content-Encoding'], 'gzip')
+            etag = rv.headers['ETag']
+            self.assertEqual(etag, identity[:-1] + '-gzip"')
+            rv = c.get('/api/v1/todos', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 304)
+            self.assertEqual(rv.headers['ETag'], etag)
+            rv = c.get('/api/v1/todos', headers={'If-None-Match': etag})
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(rv.headers['ETag'], identity)
+            rv = c.get('/api/v1/todos', headers={'Accept-Encoding': 'gzip', 'If-None-Match': identity})
+            self.assertEqual(rv.status_code, 304)
+
+    def test_deflate_stream(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/stream', headers={'Accept-Encoding': 'deflate'})
+            self.assertEqual(rv.headers['Content-Encoding'], 'deflate')
+            self.assertTrue('Content-Length' not in rv.headers)
+            self.assertEqual(len(json.loads(zlib.decompress(rv.data))), 100)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos', headers={'Accept-Encoding': 'gzip, zstd'})
+            self.assertEqual(rv.headers['Content-Encoding'], 'zstd')
+            self.assertEqual(len(json.loads(zstandard.ZstdDecompressor().decompressobj().decompress(rv.data))), 100)
+
+    def test_threshold(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todo/1', headers={'Accept-Encoding': 'gzip'})
+            self.assertTrue('Content-Encoding' not in rv.headers)
+            self.assertEqual(json.loads(rv.data)['id'], 1)
+            rv = c.get('/api/v1/todos')
+            self.assertTrue('Content-Encoding' not in rv.headers)
+            self.assertEqual(len(json.loads(rv.data)), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
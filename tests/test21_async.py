@@ -0,0 +1,154 @@
+import unittest
+import os
+import tempfile
+from functools import wraps
+from flask import Flask, request, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import AsyncApiRest, Metrics, error_api
+from sqlalchemy import event
+from werkzeug.exceptions import NotFound
+
+try:
+    import aiosqlite
+    import asgiref
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from sqlalchemy.pool import NullPool
+except ImportError:
+    aiosqlite = None
+
+
+def decorator_test_error(func):
+    @wraps(func)
+    async def decorated_view(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except NotFound:
+            return {'code': 404, 'description': 'specific error'}, 404
+    return decorated_view
+
+
+def decorator_sync_error(func):
+    @wraps(func)
+    def decorated_view(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except NotFound:
+            return {'code': 404, 'description': 'sync error'}, 404
+    return decorated_view
+
+
+@unittest.skipIf(aiosqlite is None, "aiosqlite or asgiref is not installed")
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///%s" % os.path.join(self.path, "test.db")
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            description = db.Column(db.String, nullable=True)
+            status = db.Column(db.String, nullable=True)
+
+        self.engine = create_async_engine("sqlite+aiosqlite:///%s" % os.path.join(self.path, "test.db"), poolclass=NullPool)
+        apiManager = AsyncApiRest(db, async_sessionmaker(self.engine))
+        self.apiManager = apiManager
+        for method in ['ALL', 'POST', 'GET', 'DELETE', 'PUT', 'PATCH', 'DELETE_ALL']:
+            self.swagger = apiManager.add_api(Todo, method, decorators=[decorator_test_error])
+        apiManager.add_api(Todo, 'GET', endpoint='/api/v1/sync/<int:id>', decorators=[decorator_sync_error])
+        apiManager.add_api(Todo, 'ALL', endpoint='/api/v1/sync', decorators=[decorator_sync_error, decorator_test_error])
+        self.app.register_blueprint(apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        os.remove(os.path.join(self.path, "test.db"))
+        os.rmdir(self.path)
+
+    def test_classic(self):
+        with self.app.test_client() as c:
+            todo = {'title': 'test1', 'description': 'test description1', 'status': 'test'}
+            check = {'title': 'test1', 'description': 'test description1', 'status': 'test', 'id': 1}
+            rv = c.post('/api/v1/todo', data=todo)
+            self.assertEqual(rv.status_code, 201)
+            self.assertEqual(json.loads(rv.data), check)
+            todo['title'] = "change test1"
+            rv = c.put('/api/v1/todo/1', data=todo)
+            self.assertEqual(rv.status_code, 200)
+            check['title'] = todo['title']
+            self.assertEqual(json.loads(rv.data), check)
+            check['title'] = 'other title'
+            rv = c.patch('/api/v1/todo/1', data={'title': check['title']})
+            self.assertEqual(json.loads(rv.data), check)
+            rv = c.get('/api/v1/todo/1?fields=title')
+            self.assertEqual(json.loads(rv.data), {'title': 'other title'})
+            rv = c.post('/api/v1/todo', json=[{'title': 'bulk1'}, {'title': 'bulk2'}])
+            self.assertEqual(rv.status_code, 201)
+            rv = c.get('/api/v1/todos?title__like=bulk%25')
+            self.assertEqual(len(json.loads(rv.data)), 2)
+            rv = c.delete('/api/v1/todo/1')
+            self.assertEqual(rv.status_code, 200)
+            rv = c.delete('/api/v1/todos?id__gt=0')
+            self.assertEqual(json.loads(rv.data)['count'], 2)
+            rv = c.get('/api/v1/todos')
+            self.assertEqual(json.loads(rv.data), [])
+            rv = c.get('/api/v1/todo/999')
+            self.assertEqual(rv.status_code, 404)
+            rv = c.get('/api/v1/todos?orderby=unknown')
+            self.assertEqual(rv.status_code, 400)
+
+    def test_cursor(self):
+        statements = []
+        event.listen(self.engine.sync_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        with self.app.test_client() as c:
+            c.post('/api/v1/todo', json=[{'title': 'test %s' % i, 'status': None if i < 2 else 'open'} for i in range(0, 5)])
+            ids = []
+            url = '/api/v1/todos?cursor=&limit=2&orderby=status'
+            while url is not None:
+                rv = c.get(url)
+                self.assertEqual(rv.status_code, 200)
+                ids.extend([item['id'] for item in json.loads(rv.data)])
+                url = rv.headers['Link'][1:].split('>')[0] if 'Link' in rv.headers else None
+            self.assertEqual(ids, [1, 2, 3, 4, 5])
+            self.assertEqual(len([statement for statement in statements if statement.startswith('SELECT')]), 3)
+
+    def test_sync_decorator(self):
+        with self.app.test_client() as c:
+            c.post('/api/v1/todo', data={'title': 'test1'})
+            rv = c.get('/api/v1/sync/1')
+            self.assertEqual(json.loads(rv.data)['title'], 'test1')
+            rv = c.get('/api/v1/sync/999')
+            self.assertEqual(rv.status_code, 404)
+            self.assertEqual(json.loads(rv.data)['description'], 'sync error')
+            rv = c.get('/api/v1/sync')
+            self.assertEqual(len(json.loads(rv.data)), 1)
+            rv = c.get('/api/v1/sync?orderby=unknown')
+            self.assertEqual(rv.status_code, 400)
+
+    def test_swagger(self):
+        self.assertEqual(list(self.swagger["paths"].keys()), ['/todos'])
+        self.assertTrue('delete' in self.swagger["paths"]['/todos'])
+
+    def test_metrics(self):
+        self.apiManager.metrics = Metrics()
+        with self.app.test_client() as c:
+            c.post('/api/v1/todo', data={'title': 'test1'})
+            self.assertEqual(c.get('/api/v1/todo/99').status_code, 404)
+            self.assertEqual(c.get('/api/v1/todos').status_code, 200)
+        text = self.apiManager.metrics.render()
+        self.assertIn('flask_sqlalchemy_api_errors_total{endpoint="/api/v1/todo/<int:id>",method="GET"} 1', text)
+        self.assertIn('flask_sqlalchemy_api_rows_total{endpoint="/api/v1/todos",method="GET"} 1', text)
+        self.assertIn('flask_sqlalchemy_api_sql_statements_bucket{endpoint="/api/v1/todos",method="GET",le="0"} 0', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
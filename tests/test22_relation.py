@@ -0,0 +1,95 @@
+import unittest
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, LRUCache
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        person_tag = db.Table('person_tag',
+                        db.Column('person_id', db.Integer, db.ForeignKey('person.id'), primary_key=True),
+                        db.Column('tag_id', db.Integer, db.ForeignKey('tag.id'), primary_key=True))
+
+        class Person(db.Model):
+            __tablename__ = 'person'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            computers = db.relationship('Computer', back_populates='owner')
+            tags = db.relationship('Tag', secondary=person_tag)
+
+        class Computer(db.Model):
+            __tablename__ = 'computer'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            owner_id = db.Column(db.Integer, db.ForeignKey('person.id'))
+            owner = db.relationship('Person', back_populates='computers')
+
+        class Tag(db.Model):
+            __tablename__ = 'tag'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            label = db.Column(db.String, nullable=False)
+
+        self.apiManager = ApiRest(db)
+        self.swagger = self.apiManager.add_api(Person, 'ALL', relationship='computers')
+        self.apiManager.add_api(Person, 'ALL', relationship='tags')
+        self.apiManager.add_api(Computer, 'POST')
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            red, blue = Tag(label='red'), Tag(label='blue')
+            for i in range(1, 3):
+                person = Person(name='person %s' % i, tags=[red, blue] if i == 1 else [blue])
+                db.session.add(person)
+                for j in range(1, 4):
+                    db.session.add(Computer(name='computer %s.%s' % (i, j), owner=person))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_one_to_many(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/person/2/computers?orderby=name desc')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual([item['name'] for item in result], ['computer 2.3', 'computer 2.2', 'computer 2.1'])
+            self.assertEqual(len(self.statements), 1)
+            self.assertNotIn('JOIN', self.statements[0])
+
+    def test_parameters(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/person/1/computers?name__ne=computer 1.1&fields=name&limit=1')
+            self.assertEqual(json.loads(rv.data), [{'name': 'computer 1.2'}])
+            rv = c.get('/api/v1/person/99/computers')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), [])
+
+    def test_many_to_many(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/person/1/tags?orderby=label')
+            self.assertEqual(json.loads(rv.data), [{'id': 2, 'label': 'blue'}, {'id': 1, 'label': 'red'}])
+            rv = c.get('/api/v1/person/2/tags')
+            self.assertEqual(json.loads(rv.data), [{'id': 2, 'label': 'blue'}])
+
+    def test_cache(self):
+        self.apiManager.cache = LRUCache()
+        with self.app.test_client() as c:
+            self.assertEqual(len(json.loads(c.get('/api/v1/person/1/computers').data)), 3)
+            self.assertEqual(len(json.loads(c.get('/api/v1/person/2/computers').data)), 3)
+            c.post('/api/v1/computer', json={'name': 'computer 1.4', 'owner_id': 1})
+            self.assertEqual(len(json.loads(c.get('/api/v1/person/1/computers').data)), 4)
+
+    def test_swagger(self):
+        self.assertEqual(list(self.swagger['paths'].keys()), ['/person/{id}/computers'])
+        self.assertEqual(self.swagger['paths']['/person/{id}/computers']['get']['operationId'], 'person_ALL_computers')
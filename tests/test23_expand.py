@@ -0,0 +1,118 @@
+import unittest
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, LRUCache
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        person_tag = db.Table('person_tag',
+                              db.Column('person_id', db.Integer, db.ForeignKey('person.id'), primary_key=True),
+                              db.Column('tag_id', db.Integer, db.ForeignKey('tag.id'), primary_key=True))
+
+        class Person(db.Model):
+            __tablename__ = 'person'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            badge_id = db.Column(db.Integer, db.ForeignKey('badge.id'), comment='not visible by api')
+            computers = db.relationship('Computer', back_populates='owner')
+            tags = db.relationship('Tag', secondary=person_tag)
+            badge = db.relationship('Badge')
+
+        class Computer(db.Model):
+            __tablename__ = 'computer'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            password = db.Column(db.String, comment='not visible by api')
+            owner_id = db.Column(db.Integer, db.ForeignKey('person.id'))
+            owner = db.relationship('Person', back_populates='computers')
+
+        class Tag(db.Model):
+            __tablename__ = 'tag'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            label = db.Column(db.String, nullable=False)
+
+        class Badge(db.Model):
+            __tablename__ = 'badge'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+        self.apiManager = ApiRest(db)
+        self.apiManager.add_api(Person, 'ALL')
+        self.apiManager.add_api(Person, 'GET')
+        self.apiManager.add_api(Computer, 'ALL')
+        self.apiManager.add_api(Computer, 'PATCH')
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            red, blue = Tag(label='red'), Tag(label='blue')
+            for i in range(1, 4):
+                person = Person(name='person %s' % i, tags=[red, blue] if i == 1 else [blue], badge=Badge())
+                db.session.add(person)
+                for j in range(1, 3):
+                    db.session.add(Computer(name='computer %s.%s' % (i, j), password='secret', owner=person))
+            db.session.add(Computer(name='computer 0', password='secret'))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_collection(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/persons?expand=computers&orderby=id')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(len(result), 3)
+            self.assertEqual(result[0]['computers'], [{'id': 1, 'name': 'computer 1.1', 'owner_id': 1}, {'id': 2, 'name': 'computer 1.2', 'owner_id': 1}])
+            self.assertEqual(len(self.statements), 2)
+
+    def test_single(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/computers?expand=owner&orderby=id')
+            result = json.loads(rv.data)
+            self.assertEqual(result[0]['owner'], {'id': 1, 'name': 'person 1'})
+            self.assertEqual(result[-1]['owner'], None)
+            self.assertEqual(len(self.statements), 1)
+
+    def test_nested(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/person/1?expand=computers.owner,tags')
+            self.assertEqual(rv.status_code, 200)
+            result = json.loads(rv.data)
+            self.assertEqual(result['computers'][1]['owner'], {'id': 1, 'name': 'person 1'})
+            self.assertEqual(sorted(tag['label'] for tag in result['tags']), ['blue', 'red'])
+            self.assertEqual(len(self.statements), 3)
+
+    def test_fields(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/persons?expand=tags&fields=name&ids=2')
+            self.assertEqual(json.loads(rv.data), [{'name': 'person 2', 'tags': [{'id': 2, 'label': 'blue'}]}])
+            rv = c.get('/api/v1/persons?expand=tags&cursor=&limit=1')
+            self.assertEqual(sorted(tag['label'] for tag in json.loads(rv.data)[0]['tags']), ['blue', 'red'])
+
+    def test_errors(self):
+        with self.app.test_client() as c:
+            self.assertEqual(c.get('/api/v1/persons?expand=unknown').status_code, 400)
+            self.assertEqual(c.get('/api/v1/persons?expand=badge').status_code, 400)
+            self.assertEqual(c.get('/api/v1/persons?expand=computers.owner.tags').status_code, 400)
+            self.apiManager.expand_depth = 3
+            self.assertEqual(c.get('/api/v1/persons?expand=computers.owner.tags').status_code, 200)
+
+    def test_cache(self):
+        self.apiManager.cache = LRUCache()
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/persons?expand=computers&orderby=id')
+            self.assertEqual(json.loads(rv.data)[0]['computers'][0]['name'], 'computer 1.1')
+            c.patch('/api/v1/computer/1', json={'name': 'laptop'})
+            rv = c.get('/api/v1/persons?expand=computers&orderby=id')
+            self.assertEqual(json.loads(rv.data)[0]['computers'][0]['name'], 'laptop')
@@ -0,0 +1,63 @@
+import unittest
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, Swagger
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+
+        class Note(db.Model):
+            __tablename__ = 'note'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            text = db.Column(db.String, nullable=False)
+
+        class Secret(db.Model):
+            __tablename__ = 'secret'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+        self.apiManager = ApiRest(db)
+        self.models = self.apiManager.register_models(db.Model, methods=('ALL', 'POST', 'GET'), exclude=(Secret,))
+        swagger = Swagger()
+        swagger.title = "Test"
+        self.apiManager.add_swagger(swagger=swagger)
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(Todo(title='title 1'))
+            db.session.add(Note(text='text 1'))
+            db.session.commit()
+
+    def test_register(self):
+        self.assertEqual([model.__name__ for model in self.models], ['Note', 'Todo'])
+        with self.app.test_client() as c:
+            self.assertEqual(json.loads(c.get('/api/v1/todos').data), [{'id': 1, 'title': 'title 1'}])
+            self.assertEqual(json.loads(c.get('/api/v1/note/1').data), {'id': 1, 'text': 'text 1'})
+            self.assertEqual(c.get('/api/v1/secrets').status_code, 404)
+            self.assertEqual(c.delete('/api/v1/note/1').status_code, 405)
+
+    def test_swagger(self):
+        self.assertIsNone(self.apiManager._swagger)
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/swagger.json')
+            self.assertEqual(rv.status_code, 200)
+            swagger = json.loads(rv.data)
+            self.assertEqual(swagger['info']['title'], 'Test')
+            self.assertEqual(sorted(swagger['paths'].keys()), ['/note', '/note/{id}', '/notes', '/todo', '/todo/{id}', '/todos'])
+            self.assertIs(self.apiManager.swagger, self.apiManager.swagger)
+            self.assertEqual(c.get('/api/v1/swagger.json').data, rv.data)
@@ -0,0 +1,77 @@
+import unittest
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, Metrics
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+
+        self.db = db
+        self.apiManager = ApiRest(db)
+        self.apiManager.metrics = Metrics()
+        for method in ['ALL', 'POST', 'GET']:
+            self.apiManager.add_api(Todo, method)
+        self.apiManager.add_metrics()
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 11):
+                db.session.add(Todo(title='title %s' % i))
+            db.session.commit()
+
+    def metrics(self, c):
+        rv = c.get('/api/v1/metrics')
+        self.assertEqual(rv.status_code, 200)
+        self.assertTrue(rv.headers['Content-Type'].startswith('text/plain'))
+        return rv.data.decode()
+
+    def test_requests(self):
+        with self.app.test_client() as c:
+            self.assertEqual(len(json.loads(c.get('/api/v1/todos').data)), 10)
+            c.get('/api/v1/todos?limit=2')
+            c.post('/api/v1/todo', json={'title': 'title 11'})
+            text = self.metrics(c)
+            self.assertIn('flask_sqlalchemy_api_requests_total{endpoint="/api/v1/todos",method="GET",status="200"} 2', text)
+            self.assertIn('flask_sqlalchemy_api_rows_total{endpoint="/api/v1/todos",method="GET"} 12', text)
+            self.assertIn('flask_sqlalchemy_api_sql_statements_bucket{endpoint="/api/v1/todos",method="GET",le="1"} 2', text)
+            self.assertIn('flask_sqlalchemy_api_request_duration_seconds_count{endpoint="/api/v1/todos",method="GET",phase="query"} 2', text)
+            self.assertIn('flask_sqlalchemy_api_request_duration_seconds_count{endpoint="/api/v1/todo",method="POST",phase="parse"} 1', text)
+
+    def test_errors(self):
+        with self.app.test_client() as c:
+            self.assertEqual(c.get('/api/v1/todo/99').status_code, 400)
+            c.get('/api/v1/todos?title__eq=a&orderby=unknown')
+            text = self.metrics(c)
+            self.assertIn('flask_sqlalchemy_api_errors_total{endpoint="/api/v1/todo/<int:id>",method="GET"} 1', text)
+            self.assertIn('flask_sqlalchemy_api_requests_total{endpoint="/api/v1/todos",method="GET",status="400"} 1', text)
+
+    def test_statement_error(self):
+        with self.app.test_client() as c:
+            for _ in range(0, 3):
+                self.assertEqual(c.get('/api/v1/todos?filter=unknown%3D1').status_code, 400)
+            text = self.metrics(c)
+            self.assertIn('flask_sqlalchemy_api_request_duration_seconds_count{endpoint="/api/v1/todos",method="GET",phase="query"} 3', text)
+        with self.app.app_context():
+            with self.db.engine.connect() as conn:
+                self.assertEqual(conn.info.get('api_query_start'), [])
+
+    def test_disabled(self):
+        self.apiManager.metrics = None
+        with self.app.test_client() as c:
+            self.assertEqual(c.get('/api/v1/todos').status_code, 200)
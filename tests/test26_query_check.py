@@ -0,0 +1,91 @@
+import unittest
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, QueryBudgetExceeded
+
+
+def myserialiser(obj):
+    serialize = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
+    serialize["owner"] = obj.owner.name
+    return serialize
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Person(db.Model):
+            __tablename__ = 'person'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+
+        class Computer(db.Model):
+            __tablename__ = 'computer'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            owner_id = db.Column(db.Integer, db.ForeignKey('person.id'))
+            owner = db.relationship('Person')
+
+        self.apiManager = ApiRest(db)
+        self.apiManager.query_check = 'raise'
+        self.apiManager.add_api(Computer, 'ALL', serialize=myserialiser)
+        self.apiManager.add_api(Computer, 'GET', query_budget=0)
+        self.apiManager.add_api(Person, 'ALL')
+        self.apiManager.add_api(Person, 'POST', query_budget=0)
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 21):
+                person = Person(name='person %s' % i)
+                db.session.add(Computer(name='computer %s' % i, owner=person))
+            db.session.commit()
+
+    def test_n_plus_one(self):
+        with self.app.test_client() as c:
+            with self.assertRaises(QueryBudgetExceeded) as context:
+                c.get('/api/v1/computers')
+            self.assertIn('N+1', str(context.exception))
+            self.assertEqual(len(json.loads(c.get('/api/v1/computers?limit=5').data)), 5)
+            self.assertEqual(len(json.loads(c.get('/api/v1/persons').data)), 20)
+
+    def test_budget(self):
+        with self.app.test_client() as c:
+            with self.assertRaises(QueryBudgetExceeded) as context:
+                c.get('/api/v1/computer/1')
+            self.assertIn('1 SQL statements, budget is 0', str(context.exception))
+            self.apiManager.query_budget = 0
+            with self.assertRaises(QueryBudgetExceeded):
+                c.get('/api/v1/persons')
+
+    def test_write(self):
+        with self.app.test_client() as c:
+            with self.assertLogs('flask_sqlalchemy_api.main', level='WARNING') as logs:
+                rv = c.post('/api/v1/person', json={'name': 'person 21'})
+            self.assertEqual(rv.status_code, 201)
+            self.assertIn('POST /api/v1/person: 2 SQL statements, budget is 0', logs.output[0])
+            self.apiManager.query_budget = None
+            self.apiManager.query_budgets.clear()
+            with self.assertNoLogs('flask_sqlalchemy_api.main', level='WARNING'):
+                rv = c.post('/api/v1/person', json=[{'name': 'person %s' % i} for i in range(0, 20)])
+                self.assertEqual(rv.status_code, 201)
+                # items with and without id: one INSERT by item (executemany), not a N+1
+                rv = c.post('/api/v1/person', json=[{'name': 'person %s' % i} if i % 2 == 0 else {'name': 'person %s' % i, 'id': i + 100} for i in range(0, 20)])
+                self.assertEqual(rv.status_code, 201)
+            self.assertEqual(len(json.loads(c.get('/api/v1/persons').data)), 61)
+
+    def test_warn(self):
+        self.apiManager.query_check = 'warn'
+        with self.app.test_client() as c:
+            with self.assertLogs('flask_sqlalchemy_api.main', level='WARNING') as logs:
+                rv = c.get('/api/v1/computers')
+            self.assertEqual(rv.status_code, 200)
+            self.assertIn('GET /api/v1/computers: statement executed 20 times (N+1)', logs.output[0])
@@ -0,0 +1,78 @@
+import unittest
+import datetime
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest, LRUCache
+from sqlalchemy import event
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            status = db.Column(db.String, nullable=True)
+            day = db.Column(db.Date, nullable=True)
+            secret = db.Column(db.Integer, nullable=True, comment='not visible by api')
+
+        self.apiManager = ApiRest(db)
+        for method in ['POST', 'AGGREGATE']:
+            self.swagger = self.apiManager.add_api(Todo, method)
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 11):
+                db.session.add(Todo(title='title %s' % i, status='done' if i % 3 == 0 else 'todo', day=datetime.date(2024, 1, 1 + i % 2), secret=i))
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_aggregate(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos/aggregate?groupby=status&agg=count(id),max(id),sum(id)')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(json.loads(rv.data), [{'status': 'done', 'count(id)': 3, 'max(id)': 9, 'sum(id)': 18}, {'status': 'todo', 'count(id)': 7, 'max(id)': 10, 'sum(id)': 37}])
+            self.assertEqual(len(self.statements), 1)
+            self.assertIn('GROUP BY', self.statements[0])
+            rv = c.get('/api/v1/todos/aggregate')
+            self.assertEqual(json.loads(rv.data), [{'count(*)': 10}])
+            rv = c.get('/api/v1/todos/aggregate?groupby=day&agg=min(day),avg(id)')
+            self.assertEqual(json.loads(rv.data)[0], {'day': 'Mon, 01 Jan 2024 00:00:00 GMT', 'min(day)': 'Mon, 01 Jan 2024 00:00:00 GMT', 'avg(id)': 6.0})
+
+    def test_filter(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos/aggregate?groupby=status&agg=count(*)&id__gt=5')
+            self.assertEqual(json.loads(rv.data), [{'status': 'done', 'count(*)': 2}, {'status': 'todo', 'count(*)': 3}])
+            rv = c.get('/api/v1/todos/aggregate?agg=count(*)&filter=id <= 2')
+            self.assertEqual(json.loads(rv.data), [{'count(*)': 2}])
+
+    def test_errors(self):
+        with self.app.test_client() as c:
+            self.assertEqual(c.get('/api/v1/todos/aggregate?groupby=secret').status_code, 400)
+            self.assertEqual(c.get('/api/v1/todos/aggregate?agg=sum(secret)').status_code, 400)
+            self.assertEqual(c.get('/api/v1/todos/aggregate?agg=median(id)').status_code, 400)
+            self.assertEqual(c.get('/api/v1/todos/aggregate?agg=sum(*)').status_code, 400)
+            self.assertEqual(c.get('/api/v1/todos/aggregate?agg=count(id);drop').status_code, 400)
+
+    def test_cache(self):
+        self.apiManager.cache = LRUCache()
+        with self.app.test_client() as c:
+            self.assertEqual(json.loads(c.get('/api/v1/todos/aggregate').data), [{'count(*)': 10}])
+            c.post('/api/v1/todo', json={'title': 'title 11'})
+            self.assertEqual(json.loads(c.get('/api/v1/todos/aggregate').data), [{'count(*)': 11}])
+
+    def test_swagger(self):
+        self.assertEqual(list(self.swagger["paths"].keys()), ['/todos/aggregate'])
+        self.assertEqual(self.swagger["paths"]['/todos/aggregate']['get']['operationId'], 'todo_AGGREGATE')
@@ -0,0 +1,124 @@
+import unittest
+from flask import Flask, json
+
+from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy_api import ApiRest
+from sqlalchemy import event, text
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for flask_sqlalchemy_api
+    """
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+        db = SQLAlchemy()
+        self.db = db
+
+        class Todo(db.Model):
+            __tablename__ = 'todo'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            title = db.Column(db.String, nullable=False)
+            status = db.Column(db.String, nullable=True, index=True)
+
+        class Employee(db.Model):
+            __tablename__ = 'employee'
+            id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+            name = db.Column(db.String, nullable=False)
+            kind = db.Column(db.String, nullable=False)
+            __mapper_args__ = {'polymorphic_on': kind, 'polymorphic_identity': 'employee'}
+
+        class Manager(Employee):
+            __mapper_args__ = {'polymorphic_identity': 'manager'}
+
+        self.apiManager = ApiRest(db)
+        for method in ['ALL', 'POST']:
+            self.apiManager.add_api(Todo, method)
+            self.apiManager.add_api(Employee, method)
+            self.apiManager.add_api(Manager, method)
+        self.app.register_blueprint(self.apiManager)
+
+        db.init_app(self.app)
+        with self.app.app_context():
+            db.create_all()
+            for i in range(1, 21):
+                db.session.add(Todo(title='title %s' % i, status='done' if i % 4 == 0 else 'todo'))
+            db.session.add_all([Employee(name='employee 1'), Manager(name='manager 2')])
+            db.session.commit()
+            self.statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+    def test_default(self):
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?limit=5')
+            self.assertNotIn('X-Total-Count', rv.headers)
+
+    def test_exact(self):
+        self.apiManager.total_count = 'exact'
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?limit=5&status__eq=done')
+            self.assertEqual(len(json.loads(rv.data)), 5)
+            self.assertEqual(rv.headers['X-Total-Count'], '5')
+            rv = c.get('/api/v1/todos?limit=5')
+            self.assertEqual(rv.headers['X-Total-Count'], '20')
+            self.statements.clear()
+            rv = c.get('/api/v1/todos?limit=5&offset=5')
+            self.assertEqual(rv.headers['X-Total-Count'], '20')
+            self.assertEqual(len(self.statements), 1)
+            c.post('/api/v1/todo', json={'title': 'title 21'})
+            rv = c.get('/api/v1/todos?limit=5&offset=10')
+            self.assertEqual(rv.headers['X-Total-Count'], '21')
+            rv = c.get('/api/v1/todos?limit=5&filter=id > 18')
+            self.assertEqual(rv.headers['X-Total-Count'], '3')
+
+    def test_head(self):
+        self.apiManager.total_count = 'exact'
+        with self.app.test_client() as c:
+            self.statements.clear()
+            rv = c.head('/api/v1/todos?status__eq=todo')
+            self.assertEqual(rv.status_code, 200)
+            self.assertEqual(rv.headers['X-Total-Count'], '15')
+            self.assertEqual(rv.data, b'')
+            self.assertEqual(len(self.statements), 1)
+            self.assertIn('count(*)', self.statements[0])
+
+    def test_head_default(self):
+        with self.app.test_client() as c:
+            self.statements.clear()
+            rv = c.head('/api/v1/todos?status__eq=todo')
+            self.assertEqual(rv.status_code, 200)
+            self.assertNotIn('X-Total-Count', rv.headers)
+            self.assertEqual(rv.data, b'')
+            self.assertNotIn('count(*)', ' '.join(self.statements))
+
+    def test_single_table_inheritance(self):
+        for added, total_count in enumerate(('exact', 'estimated')):
+            self.apiManager.total_count = total_count
+            with self.app.test_client() as c:
+                self.assertEqual(c.get('/api/v1/employees').headers['X-Total-Count'], str(2 + 2 * added))
+                self.assertEqual(c.get('/api/v1/managers').headers['X-Total-Count'], str(1 + added))
+                self.assertNotIn('X-Total-Count-Estimated', c.get('/api/v1/managers').headers)
+                c.post('/api/v1/manager', json={'name': 'manager'})
+                self.assertEqual(c.head('/api/v1/employees').headers['X-Total-Count'], str(3 + 2 * added))
+                self.assertEqual(c.head('/api/v1/managers').headers['X-Total-Count'], str(2 + added))
+                c.post('/api/v1/employee', json={'name': 'employee'})
+
+    def test_estimated(self):
+        self.apiManager.total_count = 'estimated'
+        with self.app.test_client() as c:
+            rv = c.get('/api/v1/todos?limit=5')
+            self.assertEqual(rv.headers['X-Total-Count'], '20')
+            self.assertNotIn('X-Total-Count-Estimated', rv.headers)
+            with self.app.app_context():
+                self.db.session.execute(text("ANALYZE"))
+                self.db.session.execute(text("INSERT INTO todo (title) VALUES ('outside of api')"))
+                self.db.session.commit()
+            self.apiManager.counts.clear()
+            rv = c.head('/api/v1/todos')
+            self.assertEqual(rv.headers['X-Total-Count'], '20')
+            self.assertEqual(rv.headers['X-Total-Count-Estimated'], 'true')
+            rv = c.head('/api/v1/todos?status__eq=done')
+            self.assertEqual(rv.headers['X-Total-Count'], '5')
+            self.assertNotIn('X-Total-Count-Estimated', rv.headers)